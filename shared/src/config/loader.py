@@ -4,12 +4,44 @@ This module provides functionality to load and save application
 configuration from/to TOML files with Pydantic validation.
 """
 
+import functools
 import tomllib
 from pathlib import Path
 from typing import Any
 
 from .models import AppConfig
 
+# Number of distinct (path, mtime, size) snapshots kept in the parse cache
+_CONFIG_CACHE_SIZE = 8
+
+
+@functools.lru_cache(maxsize=_CONFIG_CACHE_SIZE)
+def _load_cached(config_path: str, mtime_ns: int, size: int) -> AppConfig:
+    """Parse and validate a TOML configuration file snapshot.
+
+    The modification time and size are part of the cache key so that an edited
+    file is parsed again; they are not used otherwise.
+
+    Args:
+        config_path: Path to the TOML configuration file
+        mtime_ns: File modification time in nanoseconds
+        size: File size in bytes
+
+    Returns:
+        Validated application configuration
+
+    Raises:
+        ValueError: If the configuration is invalid
+        tomllib.TOMLDecodeError: If the TOML file is malformed
+    """
+    with open(config_path, "rb") as f:
+        config_dict = tomllib.load(f)
+
+    try:
+        return AppConfig(**config_dict)
+    except Exception as e:
+        raise ValueError(f"Invalid configuration: {e}") from e
+
 
 class ConfigLoader:
     """Loader for TOML configuration files with validation."""
@@ -18,6 +50,10 @@ class ConfigLoader:
     def load(config_path: str | Path) -> AppConfig:
         """Load and validate configuration from a TOML file.
 
+        Parsed configurations are cached per file snapshot (path, modification
+        time and size), so loading an unchanged file again skips TOML parsing
+        and validation.
+
         Args:
             config_path: Path to the TOML configuration file
 
@@ -34,13 +70,11 @@ class ConfigLoader:
         if not config_path.exists():
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
-        with config_path.open("rb") as f:
-            config_dict = tomllib.load(f)
+        stat = config_path.stat()
+        cached = _load_cached(str(config_path.resolve()), stat.st_mtime_ns, stat.st_size)
 
-        try:
-            return AppConfig(**config_dict)
-        except Exception as e:
-            raise ValueError(f"Invalid configuration: {e}") from e
+        # Callers (e.g. the settings page) may mutate the config, so hand out a copy
+        return cached.model_copy(deep=True)
 
     @staticmethod
     def save(config: AppConfig, config_path: str | Path) -> None:
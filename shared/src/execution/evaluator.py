@@ -4,10 +4,10 @@ This module provides functionality to evaluate agent task responses
 using an evaluation agent and extract scores and explanations.
 """
 
-import json
 import logging
 from typing import Any
 
+import pydantic_core
 from pydantic_ai import Agent
 
 from src.execution.timeout import with_timeout
@@ -27,7 +27,7 @@ async def evaluate_execution(
     """Evaluate an agent execution using the evaluation agent.
 
     Args:
-        execution: The AgentExecution instance to evaluate
+        execution: The saved AgentExecution instance to evaluate
         task_prompt: Original task prompt given to the agent
         agent_response: Response from the agent (extracted from execution)
         eval_agent: Pydantic AI evaluation agent instance
@@ -36,13 +36,51 @@ async def evaluate_execution(
     Returns:
         EvaluationResult with score (0-100) and explanation
 
+    Raises:
+        ValueError: If the execution has no ID yet, or score extraction fails or
+            score is invalid
+        TimeoutError: If evaluation exceeds timeout_seconds
+        Exception: If evaluation agent execution fails
+    """
+    if execution.id is None:
+        raise ValueError("Execution must be saved (have an ID) before it is evaluated")
+
+    score, explanation = await score_agent_response(
+        task_prompt, agent_response, eval_agent, timeout_seconds
+    )
+    logger.info(
+        f"Evaluated execution {execution.id}: score={score}, explanation_length={len(explanation)}"
+    )
+
+    return EvaluationResult(execution_id=execution.id, score=score, explanation=explanation)
+
+
+async def score_agent_response(
+    task_prompt: str,
+    agent_response: str,
+    eval_agent: Agent,
+    timeout_seconds: float = 30.0,
+) -> tuple[int, str]:
+    """Score an agent response using the evaluation agent.
+
+    Unlike evaluate_execution(), this doesn't need a saved execution, so a
+    response can be judged while it is still being persisted.
+
+    Args:
+        task_prompt: Original task prompt given to the agent
+        agent_response: Response from the agent
+        eval_agent: Pydantic AI evaluation agent instance
+        timeout_seconds: Maximum execution time for evaluation (default: 30s)
+
+    Returns:
+        Tuple of score (0-100) and explanation
+
     Raises:
         ValueError: If score extraction fails or score is invalid
         TimeoutError: If evaluation exceeds timeout_seconds
         Exception: If evaluation agent execution fails
     """
     print("\n=== STARTING EVALUATION ===")
-    print(f"Execution ID: {execution.id}")
     print(f"Task prompt: {task_prompt[:100]}")
     print(f"Agent response length: {len(agent_response)}")
     print(f"Agent response: {agent_response[:200]}")
@@ -113,31 +151,16 @@ Explanation: [your explanation]
             logger.error(f"Failed to extract explanation: {e}")
             raise
 
-        # Create evaluation result
-        evaluation = EvaluationResult(
-            execution_id=execution.id or 0,  # execution.id should be set before calling
-            score=score,
-            explanation=explanation,
-        )
-
-        logger.info(
-            f"Evaluated execution {execution.id}: score={score}, "
-            f"explanation_length={len(explanation)}"
-        )
-
-        return evaluation
+        return score, explanation
 
     except TimeoutError as e:
-        logger.error(f"Evaluation timed out for execution {execution.id}: {e}")
+        logger.error(f"Evaluation timed out: {e}")
         raise
     except ValueError as e:
-        logger.error(f"Failed to parse evaluation response for execution {execution.id}: {e}")
+        logger.error(f"Failed to parse evaluation response: {e}")
         raise
     except Exception as e:
-        logger.error(
-            f"Evaluation execution failed for execution {execution.id}: {str(e)}",
-            exc_info=True,
-        )
+        logger.error(f"Evaluation execution failed: {str(e)}", exc_info=True)
         raise
 
 
@@ -145,6 +168,8 @@ def extract_agent_response(messages_json: str | None) -> str:
     """Extract agent response text from execution messages JSON.
 
     Parses all_messages_json to extract the agent's final response text.
+    Callers holding an AgentExecution should pass its already parsed messages
+    to extract_response_from_messages() instead.
 
     Args:
         messages_json: JSON string of messages from agent execution
@@ -165,15 +190,33 @@ def extract_agent_response(messages_json: str | None) -> str:
         logger.debug("No messages JSON provided")
         return ""
 
+    # Only a JSON list of messages can hold a response. Checking the first
+    # character skips parsing error payloads ({"error": ...}) and plain text.
+    if messages_json.lstrip(" \t\r\n")[:1] != "[":
+        logger.debug("Messages JSON is not a list")
+        return ""
+
     # Log first 1000 chars of messages JSON for debugging
     logger.debug(f"Messages JSON (first 1000 chars): {messages_json[:1000]}")
 
     try:
-        messages = json.loads(messages_json)
-    except (json.JSONDecodeError, TypeError) as e:
+        messages = pydantic_core.from_json(messages_json)
+    except (ValueError, TypeError) as e:
         logger.debug(f"Could not parse messages JSON: {e}")
         return ""
 
+    return extract_response_from_messages(messages)
+
+
+def extract_response_from_messages(messages: Any) -> str:
+    """Extract agent response text from decoded execution messages.
+
+    Args:
+        messages: Decoded all_messages_json, e.g. AgentExecution.messages
+
+    Returns:
+        Agent response text, or empty string if not found
+    """
     logger.debug(f"Parsed messages type: {type(messages)}, is_list: {isinstance(messages, list)}")
 
     if not isinstance(messages, list):
@@ -145,7 +145,12 @@ def main() -> None:
     # Create UI
     @ui.page("/")
     def index() -> None:
-        """Main page route with tab navigation."""
+        """Main page route with tab navigation.
+
+        Only the task execution and settings panels are built up front; the
+        Performance and History panels, which query the database, are built
+        when their tab is first opened.
+        """
         # Create tabs
         with ui.tabs().classes("w-full") as tabs:
             main_tab = ui.tab("Task Execution", icon="play_arrow")
@@ -157,36 +162,50 @@ def main() -> None:
         from src.ui.pages.history import HistoryPage
         from src.ui.pages.performance import PerformancePage
 
-        perf_page = None
-        history_page = None
+        perf_page: PerformancePage | None = None
+        history_page: HistoryPage | None = None
 
         # Create tab panels
         with ui.tab_panels(tabs, value=main_tab).classes("w-full"):
             with ui.tab_panel(main_tab):
                 create_main_page(config, db)
 
-            with ui.tab_panel(perf_tab):
-                perf_page = PerformancePage(config, db)
-                perf_page.create()
+            # Performance page is built on first activation (see on_tab_change)
+            perf_panel = ui.tab_panel(perf_tab)
 
-            with ui.tab_panel(history_tab):
-                history_page = HistoryPage(config, db)
-                history_page.create()
+            # History page is built on first activation (see on_tab_change)
+            history_panel = ui.tab_panel(history_tab)
 
             with ui.tab_panel(settings_tab):
                 create_settings_page(config, args.config, db)
 
         # Refresh data when switching to Performance or History tabs
         def on_tab_change(e):  # type: ignore[no-untyped-def]
+            nonlocal perf_page, history_page
+
             # e.args is the new tab name (string)
             new_tab_name = e.args if hasattr(e, "args") else None
 
-            if new_tab_name == "Performance" and perf_page:
-                logging.info("Refreshing Performance page")
-                perf_page.refresh()
-            elif new_tab_name == "History" and history_page:
-                logging.info("Refreshing History page")
-                history_page.refresh()
+            if new_tab_name == "Performance":
+                if perf_page is None:
+                    # First visit: build the page, which already loads fresh data
+                    logging.info("Creating Performance page")
+                    with perf_panel:
+                        perf_page = PerformancePage(config, db)
+                        perf_page.create()
+                else:
+                    logging.info("Refreshing Performance page")
+                    perf_page.refresh()
+            elif new_tab_name == "History":
+                if history_page is None:
+                    # First visit: build the page, which already loads fresh data
+                    logging.info("Creating History page")
+                    with history_panel:
+                        history_page = HistoryPage(config, db)
+                        history_page.create()
+                else:
+                    logging.info("Refreshing History page")
+                    history_page.refresh()
 
         tabs.on("update:model-value", on_tab_change)
 
@@ -5,9 +5,86 @@ This module provides UI components for displaying agent responses and execution
 
 from nicegui import ui
 
-from src.execution.evaluator import extract_agent_response
+from src.execution.evaluator import extract_response_from_messages
 from src.models.execution import AgentExecution
 
+# Badge color per execution status
+STATUS_COLORS: dict[str, str] = {
+    "completed": "green",
+    "failed": "red",
+    "timeout": "orange",
+    "running": "blue",
+}
+
+# Score badge colors indexed by (score >= 80) << 1 | (score >= 60)
+_SCORE_PALETTE = ("red", "orange", "green", "green")
+
+
+def get_score_badge_color(score: int) -> str:
+    """Get the badge color for an evaluation score.
+
+    Args:
+        score: Evaluation score (0-100)
+
+    Returns:
+        "green" for 80+, "orange" for 60-79, "red" below 60
+    """
+    return _SCORE_PALETTE[(score >= 80) << 1 | (score >= 60)]
+
+
+# Maximum number of extracted responses kept in memory
+_RESPONSE_CACHE_SIZE = 256
+
+# (execution_id, messages length) -> extracted response text
+_response_cache: dict[tuple[int, int], str] = {}
+
+
+def _extract_response(execution: AgentExecution) -> str:
+    """Extract the response text from an execution's parsed messages.
+
+    Args:
+        execution: Agent execution to extract the response from
+
+    Returns:
+        Response text, or empty string if the messages hold none
+    """
+    try:
+        messages = execution.messages
+    except ValueError:
+        return ""
+    return extract_response_from_messages(messages)
+
+
+def get_agent_response(execution: AgentExecution) -> str:
+    """Get the response text to display for an execution.
+
+    Uses the response captured at execution time when available. Otherwise the
+    response is extracted from the message JSON once per persisted execution and
+    cached, so redrawing the panel does not parse every transcript again.
+
+    Args:
+        execution: Agent execution to get the response for
+
+    Returns:
+        Response text, or empty string if none was found
+    """
+    if execution.response_text:
+        return execution.response_text
+
+    if execution.id is None or execution.all_messages_json is None:
+        return _extract_response(execution)
+
+    key = (execution.id, len(execution.all_messages_json))
+    response_text = _response_cache.get(key)
+    if response_text is None:
+        response_text = _extract_response(execution)
+        if len(_response_cache) >= _RESPONSE_CACHE_SIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            del _response_cache[next(iter(_response_cache))]
+        _response_cache[key] = response_text
+
+    return response_text
+
 
 class AgentResponseCard:
     """Card component for displaying a single agent's response."""
@@ -22,10 +99,12 @@ class AgentResponseCard:
         self.execution = execution
         self.score = score
         self.container: ui.card | None = None
+        self._score_row: ui.row | None = None
+        self._score_badge: ui.badge | None = None
 
     def create(self) -> None:
         """Create the agent response card UI component."""
-        model_id = f"{self.execution.model_provider}/{self.execution.model_name}"
+        model_id = self.execution.model_identifier
 
         with ui.card().classes("w-full") as card:
             self.container = card
@@ -34,31 +113,26 @@ class AgentResponseCard:
             with ui.row().classes("w-full items-center justify-between"):
                 ui.label(model_id).classes("text-subtitle1 font-bold")
                 # Status badge
-                status_color = {
-                    "completed": "green",
-                    "failed": "red",
-                    "timeout": "orange",
-                    "running": "blue",
-                }.get(self.execution.status, "grey")
+                status_color = STATUS_COLORS.get(self.execution.status, "grey")
                 ui.badge(self.execution.status).props(f"color={status_color}")
 
-            # Score if available
-            if self.score is not None:
-                score_color = (
-                    "green" if self.score >= 80 else "orange" if self.score >= 60 else "red"
-                )
-                with ui.row().classes("w-full"):
-                    ui.label("Score: ").classes("font-bold")
-                    ui.badge(str(self.score)).props(f"color={score_color}")
+            # Score (hidden until available)
+            with ui.row().classes("w-full") as score_row:
+                ui.label("Score: ").classes("font-bold")
+                self._score_badge = ui.badge()
+            self._score_row = score_row
+            self.update_score(self.score)
 
             # Separator
             ui.separator().classes("my-3")
 
             # Agent response text
-            response_text = extract_agent_response(self.execution.all_messages_json)
+            response_text = get_agent_response(self.execution)
 
             if response_text:
                 ui.label("Response:").classes("font-bold")
+                # NiceGUI caches the Markdown-to-HTML conversion per content string,
+                # so rebuilding a card does not re-parse an unchanged response.
                 ui.markdown(response_text).classes("w-full text-body2")
             else:
                 ui.label("No response available").classes("text-grey-6")
@@ -79,6 +153,27 @@ class AgentResponseCard:
                         "text-caption"
                     )
 
+    def update_score(self, score: int | None) -> None:
+        """Update the score badge without rebuilding the card.
+
+        Args:
+            score: New evaluation score (0-100), or None to hide the score
+        """
+        self.score = score
+        if self._score_row is None or self._score_badge is None:
+            return
+
+        self._score_row.set_visibility(score is not None)
+        if score is not None:
+            self._score_badge.set_text(str(score))
+            self._score_badge.props(f"color={get_score_badge_color(score)}")
+
+    def delete(self) -> None:
+        """Remove the card from the UI."""
+        if self.container is not None:
+            self.container.delete()
+            self.container = None
+
 
 class AgentResponsesPanel:
     """Panel component for displaying multiple agent responses."""
@@ -96,79 +191,114 @@ class AgentResponsesPanel:
         self.scores = scores or {}
         self.container: ui.card | None = None
         self.response_cards: list[AgentResponseCard] = []
+        self._empty_label: ui.label | None = None
 
     def create(self) -> None:
         """Create the agent responses panel UI component."""
         with ui.card().classes("w-full") as card:
             self.container = card
-            ui.label("Agent Responses").classes("text-h6")
+            self._render()
+
+    def _render(self) -> None:
+        """Build the panel content from scratch (must be called inside the container)."""
+        self.response_cards = []
+        ui.label("Agent Responses").classes("text-h6")
 
-            if not self.executions:
-                ui.label("No executions available").classes("text-grey-6")
-                return
+        if not self.executions:
+            self._empty_label = ui.label("No executions available").classes("text-grey-6")
+            return
 
-            # Create response cards for each execution
-            for execution in self.executions:
-                score = None
-                if execution.id:
-                    score = self.scores.get(execution.id)
+        self._empty_label = None
+        for execution in self.executions:
+            self.response_cards.append(self._create_card(execution))
 
-                response_card = AgentResponseCard(execution, score)
-                response_card.create()
-                self.response_cards.append(response_card)
+    def _create_card(self, execution: AgentExecution) -> AgentResponseCard:
+        """Create a response card for an execution (inside the current context).
+
+        Args:
+            execution: Agent execution to display
+
+        Returns:
+            Created AgentResponseCard
+        """
+        response_card = AgentResponseCard(execution, self._score_for(execution))
+        response_card.create()
+        return response_card
+
+    def _score_for(self, execution: AgentExecution) -> int | None:
+        """Look up the score of an execution.
+
+        Args:
+            execution: Agent execution
+
+        Returns:
+            Score if the execution has been evaluated, None otherwise
+        """
+        if execution.id is None:
+            return None
+        return self.scores.get(execution.id)
 
     def update_executions(
         self, executions: list[AgentExecution], scores: dict[int, int] | None = None
     ) -> None:
         """Update the panel with new list of executions.
 
+        Cards are reconciled by execution ID: unchanged executions keep their
+        card and only get their score badge updated, changed or new executions
+        get a new card, and cards of executions no longer listed are removed.
+
         Args:
             executions: New list of executions
             scores: Optional dictionary mapping execution_id to score
         """
         self.executions = executions
         self.scores = scores or {}
-        self.response_cards = []
 
-        if self.container:
-            self.container.clear()
-            with self.container:
-                ui.label("Agent Responses").classes("text-h6")
+        if not self.container:
+            return
 
-                if not self.executions:
-                    ui.label("No executions available").classes("text-grey-6")
-                    return
+        if not self.executions or self._empty_label is not None:
+            # Switching from or to the empty state changes the layout
+            self.refresh()
+            return
 
-                # Create response cards for each execution
-                for execution in self.executions:
-                    score = None
-                    if execution.id:
-                        score = self.scores.get(execution.id)
+        previous_cards = {
+            card.execution.id: card for card in self.response_cards if card.execution.id is not None
+        }
+        cards: list[AgentResponseCard] = []
 
-                    response_card = AgentResponseCard(execution, score)
-                    response_card.create()
-                    self.response_cards.append(response_card)
+        for index, execution in enumerate(self.executions):
+            card = previous_cards.pop(execution.id, None) if execution.id is not None else None
+
+            if card is not None and card.execution == execution:
+                card.update_score(self._score_for(execution))
+            else:
+                if card is not None:
+                    card.delete()
+                with self.container:
+                    card = self._create_card(execution)
+
+            # Keep cards in execution order (index 0 is the panel title)
+            children = self.container.default_slot.children
+            if card.container is not None and children.index(card.container) != index + 1:
+                card.container.move(self.container, target_index=index + 1)
+
+            cards.append(card)
+
+        # Remove cards of executions that are no longer listed
+        kept = {id(card) for card in cards}
+        for card in self.response_cards:
+            if id(card) not in kept:
+                card.delete()
+
+        self.response_cards = cards
 
     def refresh(self) -> None:
         """Refresh the panel display with latest data."""
         if self.container:
             self.container.clear()
             with self.container:
-                ui.label("Agent Responses").classes("text-h6")
-
-                if not self.executions:
-                    ui.label("No executions available").classes("text-grey-6")
-                    return
-
-                # Create response cards for each execution
-                for execution in self.executions:
-                    score = None
-                    if execution.id:
-                        score = self.scores.get(execution.id)
-
-                    response_card = AgentResponseCard(execution, score)
-                    response_card.create()
-                    self.response_cards.append(response_card)
+                self._render()
 
 
 def create_agent_responses_panel(
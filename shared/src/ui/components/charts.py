@@ -4,224 +4,426 @@ This module provides UI components for visualizing performance metrics
 using Plotly charts via NiceGUI's ui.plotly() integration.
 """
 
+import asyncio
+import functools
+import heapq
+import json
 import logging
+import math
+from dataclasses import dataclass, field
 from typing import Any
 
 import plotly.graph_objects as go  # type: ignore[import-untyped]
-from nicegui import ui
+from nicegui import background_tasks, ui
 
 from src.database.repositories import TaskRepository
 
 logger = logging.getLogger(__name__)
 
+# Refresh requests arriving within this window are coalesced into one redraw
+REFRESH_DEBOUNCE_SECONDS = 0.01
+
+# Maximum number of bars per chart; less active models are merged into an "Other" bar.
+# This keeps the charts far below the size where Plotly's SVG bar rendering slows
+# down, so they don't need a WebGL (scattergl) fallback.
+MAX_CHART_BARS = 25
+
+# Delay after the last size change of a chart before it is re-laid out
+RESIZE_DEBOUNCE_MS = 100
+
+# How long the resize observer script waits for the plots to mount and Plotly to load
+RESIZE_OBSERVER_WAIT_MS = 10_000
+
+# Re-lays out the given plots (by DOM id) when their size changes, e.g. when the
+# window or a surrounding panel is resized. The script is sent right after the
+# plots are created, so it polls until they are mounted and Plotly is loaded.
+# %s: JSON list of ids, %d: resize delay in ms, %d: maximum wait in ms
+_RESIZE_OBSERVER_JS = """
+(() => {
+    if (typeof ResizeObserver === "undefined") return;
+    const ids = %s;
+    const delay = %d;
+    const deadline = Date.now() + %d;
+    const attach = () => {
+        const plots = ids.map((id) => document.getElementById(id)).filter((el) => el);
+        if (!window.Plotly || plots.length < ids.length) {
+            if (Date.now() < deadline) setTimeout(attach, 100);
+            return;
+        }
+        let timer = null;
+        const resize = (el) => {
+            // Skip plots that are hidden or not drawn yet
+            if (el._fullLayout) window.Plotly.Plots.resize(el).catch(() => {});
+        };
+        const observer = new ResizeObserver(() => {
+            clearTimeout(timer);
+            timer = setTimeout(() => plots.forEach(resize), delay);
+        });
+        plots.forEach((el) => observer.observe(el));
+    };
+    attach();
+})();
+"""
 
-def create_duration_chart(metrics: list[dict[str, Any]]) -> go.Figure:
-    """Create a bar chart for execution durations with error bars.
+# Duration, token and throughput figures, in display order
+ChartFigures = tuple[go.Figure, go.Figure, go.Figure]
+
+
+def _bar_layout(title: str, yaxis_title: str) -> dict[str, Any]:
+    """Build the static layout of a per-model bar chart.
 
     Args:
-        metrics: List of aggregated performance metrics dictionaries
+        title: Chart title
+        yaxis_title: Y axis title
 
     Returns:
-        Plotly Figure with duration bar chart and error bars
+        Layout properties for go.Figure
     """
-    if not metrics:
-        # Return empty chart with message
-        fig = go.Figure()
-        fig.add_annotation(
-            text="No data available",
-            xref="paper",
-            yref="paper",
-            x=0.5,
-            y=0.5,
-            showarrow=False,
-            font={"size": 20, "color": "gray"},
-        )
-        fig.update_layout(
-            title="Execution Duration by Model (Average ± Std Dev)",
-            xaxis={"visible": False},
-            yaxis={"visible": False},
+    return {
+        "title": {"text": title},
+        "xaxis": {"title": {"text": "Model"}},
+        "yaxis": {"title": {"text": yaxis_title}},
+        "hovermode": "x unified",
+        "showlegend": False,
+    }
+
+
+def _empty_layout(title: str) -> dict[str, Any]:
+    """Build the layout of a chart that has no data to plot.
+
+    Args:
+        title: Chart title
+
+    Returns:
+        Layout properties for go.Figure, with a "No data available" message
+    """
+    return {
+        "title": {"text": title},
+        "xaxis": {"visible": False},
+        "yaxis": {"visible": False},
+        "annotations": [
+            {
+                "text": "No data available",
+                "xref": "paper",
+                "yref": "paper",
+                "x": 0.5,
+                "y": 0.5,
+                "showarrow": False,
+                "font": {"size": 20, "color": "gray"},
+            }
+        ],
+    }
+
+
+# Chart layouts only depend on the chart type, so they are built once and
+# passed to go.Figure instead of being assembled with update_layout() per refresh
+_DURATION_LAYOUT = _bar_layout(
+    "Execution Duration by Model (Average ± Std Dev)", "Duration (seconds)"
+)
+_TOKEN_LAYOUT = _bar_layout("Token Consumption by Model (Average ± Std Dev)", "Tokens")
+_THROUGHPUT_LAYOUT = _bar_layout("Throughput by Model (Average Tokens/Second)", "Tokens per Second")
+_DURATION_EMPTY_LAYOUT = _empty_layout("Execution Duration by Model (Average ± Std Dev)")
+_TOKEN_EMPTY_LAYOUT = _empty_layout("Token Consumption by Model (Average ± Std Dev)")
+_THROUGHPUT_EMPTY_LAYOUT = _empty_layout("Throughput by Model (Average)")
+
+
+@functools.lru_cache(maxsize=256)
+def _duration_bar_text(avg: float, count: int) -> str:
+    """Format the label shown above a duration bar.
+
+    Args:
+        avg: Average duration in seconds, rounded to two decimals
+        count: Number of executions
+
+    Returns:
+        Label such as "1.50s (n=3)"
+    """
+    return f"{avg:.2f}s (n={count})"
+
+
+def _pooled_stats(rows: list[dict[str, Any]], mean_key: str, std_key: str) -> tuple[float, float]:
+    """Combine per-model means and sample standard deviations into one group.
+
+    Args:
+        rows: Metrics rows to combine
+        mean_key: Key of the per-row mean
+        std_key: Key of the per-row sample standard deviation
+
+    Returns:
+        Tuple of (mean, sample standard deviation) over all executions of the rows
+    """
+    total = sum(int(m["execution_count"]) for m in rows)
+    mean = sum(float(m[mean_key]) * int(m["execution_count"]) for m in rows) / total
+    if total < 2:
+        return mean, 0.0
+
+    # Within-group plus between-group sum of squares
+    sum_squares = sum(
+        (int(m["execution_count"]) - 1) * float(m[std_key]) ** 2
+        + int(m["execution_count"]) * (float(m[mean_key]) - mean) ** 2
+        for m in rows
+    )
+    return mean, math.sqrt(sum_squares / (total - 1))
+
+
+def limit_chart_metrics(
+    metrics: list[dict[str, Any]], max_bars: int = MAX_CHART_BARS
+) -> list[dict[str, Any]]:
+    """Keep the most executed models and merge the rest into one "Other" row.
+
+    Rendering time of the bar charts grows with the number of bars, so beyond
+    max_bars models the least executed ones are aggregated instead of plotted
+    individually. The kept rows stay in their original order.
+
+    Args:
+        metrics: Aggregated performance metrics from get_performance_metrics()
+        max_bars: Maximum number of rows to return, including the "Other" row
+
+    Returns:
+        At most max_bars metrics rows
+
+    Raises:
+        ValueError: If max_bars is less than 2
+    """
+    if max_bars < 2:
+        raise ValueError(f"max_bars must be at least 2, got {max_bars}")
+    if len(metrics) <= max_bars:
+        return metrics
+
+    keep = set(
+        heapq.nlargest(
+            max_bars - 1,
+            range(len(metrics)),
+            key=lambda i: int(metrics[i]["execution_count"]),
         )
-        return fig
+    )
+    kept = [m for i, m in enumerate(metrics) if i in keep]
+    rest = [m for i, m in enumerate(metrics) if i not in keep]
+
+    avg_duration, std_duration = _pooled_stats(rest, "avg_duration", "std_duration")
+    avg_tokens, std_tokens = _pooled_stats(rest, "avg_tokens", "std_tokens")
+    kept.append(
+        {
+            "model_provider": "Other",
+            "model_name": f"{len(rest)} models",
+            "model_id": f"Other ({len(rest)} models)",
+            "avg_duration": avg_duration,
+            "std_duration": std_duration,
+            "min_duration": min(float(m["min_duration"]) for m in rest),
+            "max_duration": max(float(m["max_duration"]) for m in rest),
+            "avg_tokens": avg_tokens,
+            "std_tokens": std_tokens,
+            "avg_tokens_per_sec": avg_tokens / avg_duration if avg_duration > 0 else 0.0,
+            "execution_count": sum(int(m["execution_count"]) for m in rest),
+        }
+    )
+    return kept
+
+
+@dataclass(slots=True)
+class ChartSeries:
+    """Per-model series shared by the performance charts.
+
+    Attributes:
+        models: Model identifiers ("provider/model"), one per bar
+        execution_counts: Number of executions per model
+        avg_durations: Average duration in seconds
+        std_durations: Standard deviation of duration
+        min_durations: Minimum duration
+        max_durations: Maximum duration
+        avg_tokens: Average token count
+        std_tokens: Standard deviation of token count
+        tokens_per_sec: Average throughput in tokens per second
+    """
+
+    models: list[str] = field(default_factory=list)
+    execution_counts: list[int] = field(default_factory=list)
+    avg_durations: list[float] = field(default_factory=list)
+    std_durations: list[float] = field(default_factory=list)
+    min_durations: list[float] = field(default_factory=list)
+    max_durations: list[float] = field(default_factory=list)
+    avg_tokens: list[float] = field(default_factory=list)
+    std_tokens: list[float] = field(default_factory=list)
+    tokens_per_sec: list[float] = field(default_factory=list)
+
+
+def extract_chart_series(metrics: list[dict[str, Any]]) -> ChartSeries:
+    """Extract the series of all charts in a single pass over the metrics.
+
+    Args:
+        metrics: Aggregated performance metrics from get_performance_metrics()
+
+    Returns:
+        ChartSeries with one entry per metrics row
+    """
+    series = ChartSeries()
+    for m in metrics:
+        series.models.append(m["model_id"])
+        series.execution_counts.append(int(m["execution_count"]))
+        series.avg_durations.append(float(m["avg_duration"]))
+        series.std_durations.append(float(m["std_duration"]))
+        series.min_durations.append(float(m["min_duration"]))
+        series.max_durations.append(float(m["max_duration"]))
+        series.avg_tokens.append(float(m["avg_tokens"]))
+        series.std_tokens.append(float(m["std_tokens"]))
+        series.tokens_per_sec.append(float(m["avg_tokens_per_sec"]))
+    return series
+
+
+def _as_series(metrics: list[dict[str, Any]] | ChartSeries) -> ChartSeries:
+    """Return the chart series, extracting them from raw metrics if needed."""
+    if isinstance(metrics, ChartSeries):
+        return metrics
+    return extract_chart_series(metrics)
+
+
+def create_duration_chart(metrics: list[dict[str, Any]] | ChartSeries) -> go.Figure:
+    """Create a bar chart for execution durations with error bars.
 
-    # Extract data
-    models = [f"{m['model_provider']}/{m['model_name']}" for m in metrics]
-    avg_durations = [float(m["avg_duration"]) for m in metrics]
-    std_durations = [float(m["std_duration"]) for m in metrics]
-    counts = [int(m["execution_count"]) for m in metrics]
+    Args:
+        metrics: Chart series, or aggregated performance metrics from
+            get_performance_metrics()
+
+    Returns:
+        Plotly Figure with duration bar chart and error bars
+    """
+    series = _as_series(metrics)
+    if not series.models:
+        return go.Figure(layout=_DURATION_EMPTY_LAYOUT)
 
-    # Create hover text with detailed statistics
+    bar_texts = [
+        _duration_bar_text(round(avg, 2), count)
+        for avg, count in zip(series.avg_durations, series.execution_counts, strict=True)
+    ]
     hover_texts = [
         f"Average: {avg:.2f}s<br>"
         f"Std Dev: {std:.2f}s<br>"
-        f"Min: {m['min_duration']:.2f}s<br>"
-        f"Max: {m['max_duration']:.2f}s<br>"
+        f"Min: {low:.2f}s<br>"
+        f"Max: {high:.2f}s<br>"
         f"Executions: {count}"
-        for avg, std, count, m in zip(avg_durations, std_durations, counts, metrics, strict=True)
+        for avg, std, low, high, count in zip(
+            series.avg_durations,
+            series.std_durations,
+            series.min_durations,
+            series.max_durations,
+            series.execution_counts,
+            strict=True,
+        )
     ]
 
     # Create bar chart with error bars
     fig = go.Figure(
         data=[
             go.Bar(
-                x=models,
-                y=avg_durations,
-                error_y={"type": "data", "array": std_durations, "visible": True},
-                marker={"color": "skyblue"},
-                text=[f"{d:.2f}s (n={c})" for d, c in zip(avg_durations, counts, strict=True)],
+                x=series.models,
+                y=series.avg_durations,
+                error_y={"type": "data", "array": series.std_durations, "visible": True},
+                marker={"color": "skyblue", "line": {"width": 0}},
+                text=bar_texts,
                 textposition="outside",
                 hovertext=hover_texts,
                 hoverinfo="text",
             )
-        ]
-    )
-
-    fig.update_layout(
-        title="Execution Duration by Model (Average ± Std Dev)",
-        xaxis_title="Model",
-        yaxis_title="Duration (seconds)",
-        hovermode="x unified",
-        showlegend=False,
+        ],
+        layout=_DURATION_LAYOUT,
     )
 
     return fig
 
 
-def create_token_chart(metrics: list[dict[str, Any]]) -> go.Figure:
+def create_token_chart(metrics: list[dict[str, Any]] | ChartSeries) -> go.Figure:
     """Create a bar chart for token consumption with error bars.
 
     Args:
-        metrics: List of aggregated performance metrics dictionaries
+        metrics: Chart series, or aggregated performance metrics from
+            get_performance_metrics()
 
     Returns:
         Plotly Figure with token bar chart and error bars
     """
-    if not metrics:
-        # Return empty chart with message
-        fig = go.Figure()
-        fig.add_annotation(
-            text="No data available",
-            xref="paper",
-            yref="paper",
-            x=0.5,
-            y=0.5,
-            showarrow=False,
-            font={"size": 20, "color": "gray"},
-        )
-        fig.update_layout(
-            title="Token Consumption by Model (Average ± Std Dev)",
-            xaxis={"visible": False},
-            yaxis={"visible": False},
-        )
-        return fig
-
-    # Extract data
-    models = [f"{m['model_provider']}/{m['model_name']}" for m in metrics]
-    avg_tokens = [float(m["avg_tokens"]) for m in metrics]
-    std_tokens = [float(m["std_tokens"]) for m in metrics]
-    counts = [int(m["execution_count"]) for m in metrics]
+    series = _as_series(metrics)
+    if not series.models:
+        return go.Figure(layout=_TOKEN_EMPTY_LAYOUT)
 
-    # Create hover text with detailed statistics
+    bar_texts = [
+        f"{int(avg)} (n={count})"
+        for avg, count in zip(series.avg_tokens, series.execution_counts, strict=True)
+    ]
     hover_texts = [
         f"Average: {avg:.0f} tokens<br>Std Dev: {std:.0f}<br>Executions: {count}"
-        for avg, std, count in zip(avg_tokens, std_tokens, counts, strict=True)
+        for avg, std, count in zip(
+            series.avg_tokens, series.std_tokens, series.execution_counts, strict=True
+        )
     ]
 
     # Create bar chart with error bars
     fig = go.Figure(
         data=[
             go.Bar(
-                x=models,
-                y=avg_tokens,
-                error_y={"type": "data", "array": std_tokens, "visible": True},
-                marker={"color": "lightgreen"},
-                text=[f"{int(t)} (n={c})" for t, c in zip(avg_tokens, counts, strict=True)],
+                x=series.models,
+                y=series.avg_tokens,
+                error_y={"type": "data", "array": series.std_tokens, "visible": True},
+                marker={"color": "lightgreen", "line": {"width": 0}},
+                text=bar_texts,
                 textposition="outside",
                 hovertext=hover_texts,
                 hoverinfo="text",
             )
-        ]
-    )
-
-    fig.update_layout(
-        title="Token Consumption by Model (Average ± Std Dev)",
-        xaxis_title="Model",
-        yaxis_title="Tokens",
-        hovermode="x unified",
-        showlegend=False,
+        ],
+        layout=_TOKEN_LAYOUT,
     )
 
     return fig
 
 
-def create_tokens_per_second_chart(metrics: list[dict[str, Any]]) -> go.Figure:
+def create_tokens_per_second_chart(metrics: list[dict[str, Any]] | ChartSeries) -> go.Figure:
     """Create a bar chart for tokens per second (throughput).
 
     Args:
-        metrics: List of aggregated performance metrics dictionaries
+        metrics: Chart series, or aggregated performance metrics from
+            get_performance_metrics()
 
     Returns:
         Plotly Figure with tokens/sec bar chart
     """
-    if not metrics:
-        # Return empty chart with message
-        fig = go.Figure()
-        fig.add_annotation(
-            text="No data available",
-            xref="paper",
-            yref="paper",
-            x=0.5,
-            y=0.5,
-            showarrow=False,
-            font={"size": 20, "color": "gray"},
+    series = _as_series(metrics)
+    if not series.models:
+        return go.Figure(layout=_THROUGHPUT_EMPTY_LAYOUT)
+
+    bar_texts = [
+        f"{tokens_per_sec:.1f} (n={count})"
+        for tokens_per_sec, count in zip(
+            series.tokens_per_sec, series.execution_counts, strict=True
         )
-        fig.update_layout(
-            title="Throughput by Model (Average)",
-            xaxis={"visible": False},
-            yaxis={"visible": False},
-        )
-        return fig
-
-    # Extract data and calculate average tokens per second
-    models = [f"{m['model_provider']}/{m['model_name']}" for m in metrics]
-    avg_throughput = []
-    counts = [int(m["execution_count"]) for m in metrics]
-
-    for m in metrics:
-        avg_duration = float(m["avg_duration"])
-        avg_tokens = float(m["avg_tokens"])
-        tokens_per_sec = avg_tokens / avg_duration if avg_duration > 0 else 0
-        avg_throughput.append(tokens_per_sec)
-
-    # Create hover text with detailed statistics
+    ]
     hover_texts = [
-        f"Throughput: {tps:.1f} tokens/s<br>"
-        f"Avg Duration: {m['avg_duration']:.2f}s<br>"
-        f"Avg Tokens: {m['avg_tokens']:.0f}<br>"
+        f"Throughput: {tokens_per_sec:.1f} tokens/s<br>"
+        f"Avg Duration: {duration:.2f}s<br>"
+        f"Avg Tokens: {tokens:.0f}<br>"
         f"Executions: {count}"
-        for tps, count, m in zip(avg_throughput, counts, metrics, strict=True)
+        for tokens_per_sec, duration, tokens, count in zip(
+            series.tokens_per_sec,
+            series.avg_durations,
+            series.avg_tokens,
+            series.execution_counts,
+            strict=True,
+        )
     ]
 
-    # Create bar chart
+    # Create bar chart (throughput is computed by the metrics query)
     fig = go.Figure(
         data=[
             go.Bar(
-                x=models,
-                y=avg_throughput,
-                marker={"color": "coral"},
-                text=[f"{t:.1f} (n={c})" for t, c in zip(avg_throughput, counts, strict=True)],
+                x=series.models,
+                y=series.tokens_per_sec,
+                marker={"color": "coral", "line": {"width": 0}},
+                text=bar_texts,
                 textposition="outside",
                 hovertext=hover_texts,
                 hoverinfo="text",
             )
-        ]
-    )
-
-    fig.update_layout(
-        title="Throughput by Model (Average Tokens/Second)",
-        xaxis_title="Model",
-        yaxis_title="Tokens per Second",
-        hovermode="x unified",
-        showlegend=False,
+        ],
+        layout=_THROUGHPUT_LAYOUT,
     )
 
     return fig
@@ -246,82 +448,235 @@ class PerformanceCharts:
         self.duration_plot: ui.plotly | None = None
         self.token_plot: ui.plotly | None = None
         self.throughput_plot: ui.plotly | None = None
+        self._pending_refresh: asyncio.TimerHandle | None = None
+        self._placeholder: ui.column | None = None
+        # Metrics currently plotted, used to skip redraws when nothing changed
+        self._shown_metrics: list[dict[str, Any]] | None = None
+        # Bumped whenever a refresh is scheduled, so results of superseded loads are dropped
+        self._refresh_generation = 0
 
     def create(self) -> None:
-        """Create the performance charts UI component."""
+        """Create the performance charts UI component.
+
+        Skeleton placeholders are shown right away; the metrics are queried in a
+        worker thread and the charts replace the placeholders once loaded.
+        """
         with ui.card().classes("w-full") as card:
             self.container = card
             ui.label("Performance Metrics").classes("text-h6")
 
-            # Query metrics
-            metrics = self.repository.get_performance_metrics(self.task_id)
+            with ui.column().classes("w-full gap-4") as placeholder:
+                for _ in range(3):
+                    ui.skeleton().classes("w-full h-64")
+            self._placeholder = placeholder
+
+        background_tasks.create(self._load_charts(), name="performance_charts_load")
+
+    async def _load_charts(self) -> None:
+        """Build the charts off the event loop and replace the skeleton placeholders."""
+        generation = self._refresh_generation
+        metrics, figures = await asyncio.to_thread(self._prepare, self.task_id)
+
+        if self.container is None or generation != self._refresh_generation or figures is None:
+            # A refresh was scheduled meanwhile and will build the charts
+            return
+
+        self._show_charts(metrics, figures)
+
+    def _prepare(self, task_id: int | None) -> tuple[list[dict[str, Any]], ChartFigures | None]:
+        """Query the metrics for a task and build the chart figures.
 
-            if not metrics:
-                ui.label("No performance data available").classes("text-grey-6")
-                return
+        Does not touch any UI element, so it can run in a worker thread. Without
+        metrics the figures are empty charts with a "No data available" message.
+
+        Args:
+            task_id: Task ID to query metrics for, or None for all tasks
+
+        Returns:
+            Tuple of (metrics, figures); figures is None if the metrics equal the
+            ones already plotted, so there is nothing to redraw
+        """
+        metrics = limit_chart_metrics(self.repository.get_performance_metrics(task_id))
+        if metrics == self._shown_metrics:
+            return metrics, None
+
+        series = extract_chart_series(metrics)
+        figures = (
+            create_duration_chart(series),
+            create_token_chart(series),
+            create_tokens_per_second_chart(series),
+        )
+        return metrics, figures
+
+    def _show_charts(self, metrics: list[dict[str, Any]], figures: ChartFigures) -> None:
+        """Replace the skeleton placeholders with the chart widgets.
+
+        Args:
+            metrics: Aggregated performance metrics the figures were built from
+            figures: Duration, token and throughput figures
+        """
+        if self.container is None:
+            return
+
+        self._shown_metrics = metrics
+
+        if self._placeholder is not None:
+            self._placeholder.delete()
+            self._placeholder = None
+        with self.container:
+            self._render_charts(figures)
+
+    def _render_charts(self, figures: ChartFigures) -> None:
+        """Create the chart widgets (must be called inside the container context).
+
+        The widgets are created once; later refreshes replace their figures.
+
+        Args:
+            figures: Duration, token and throughput figures
+        """
+        duration_fig, token_fig, throughput_fig = figures
 
-            # Create charts
-            with ui.row().classes("w-full gap-4"):
-                with ui.column().classes("flex-1"):
-                    duration_fig = create_duration_chart(metrics)
-                    self.duration_plot = ui.plotly(duration_fig).classes("w-full")
+        # Create charts
+        with ui.row().classes("w-full gap-4"):
+            with ui.column().classes("flex-1"):
+                self.duration_plot = ui.plotly(duration_fig).classes("w-full")
 
-                with ui.column().classes("flex-1"):
-                    token_fig = create_token_chart(metrics)
-                    self.token_plot = ui.plotly(token_fig).classes("w-full")
+            with ui.column().classes("flex-1"):
+                self.token_plot = ui.plotly(token_fig).classes("w-full")
 
-            # Throughput chart (full width)
-            throughput_fig = create_tokens_per_second_chart(metrics)
-            self.throughput_plot = ui.plotly(throughput_fig).classes("w-full")
+        # Throughput chart (full width)
+        self.throughput_plot = ui.plotly(throughput_fig).classes("w-full")
+
+        self._observe_resize()
+
+    def _observe_resize(self) -> None:
+        """Resize the charts in the browser whenever their width changes."""
+        plots = [self.duration_plot, self.token_plot, self.throughput_plot]
+        plot_ids = [plot.html_id for plot in plots if plot is not None]
+        if self.container is None or not plot_ids:
+            return
+
+        self.container.client.run_javascript(
+            _RESIZE_OBSERVER_JS
+            % (json.dumps(plot_ids), RESIZE_DEBOUNCE_MS, RESIZE_OBSERVER_WAIT_MS)
+        )
+
+    def _update_charts(self, figures: ChartFigures) -> bool:
+        """Replace the figures of the existing chart widgets in place.
+
+        ui.plotly sends each figure as Figure.to_plotly_json(), which NiceGUI
+        encodes with orjson, and the client applies it with Plotly.react, which
+        diffs it against the current plot instead of re-initializing it.
+
+        Args:
+            figures: Duration, token and throughput figures
+
+        Returns:
+            True if the charts were updated, False if the widgets don't exist yet
+        """
+        if self.duration_plot is None or self.token_plot is None or self.throughput_plot is None:
+            return False
+
+        self.duration_plot.figure, self.token_plot.figure, self.throughput_plot.figure = figures
+        # Queued in the same tick, the three updates reach the client in one message
+        ui.update(self.duration_plot, self.token_plot, self.throughput_plot)
+        return True
 
     def update_task(self, task_id: int | None) -> None:
         """Update charts for a different task.
 
+        The existing chart widgets are reused; selecting the task that is
+        already shown does nothing (use refresh() to pick up new data).
+
         Args:
             task_id: New task ID to display metrics for, or None for all tasks
         """
+        if task_id == self.task_id or self.container is None:
+            self.task_id = task_id
+            return
+
         self.task_id = task_id
-        if self.container:
-            self.container.clear()
-            with self.container:
-                ui.label("Performance Metrics").classes("text-h6")
-                self.create()
+        self.refresh()
 
     def refresh(self) -> None:
-        """Refresh the charts with latest data."""
-        logger.info("PerformanceCharts.refresh() called")
-        if self.container:
-            logger.info(f"Container exists, clearing and re-rendering for task_id={self.task_id}")
-            self.container.clear()
-            with self.container:
-                ui.label("Performance Metrics").classes("text-h6")
-
-                # Query metrics
-                metrics = self.repository.get_performance_metrics(self.task_id)
-                logger.info(f"Retrieved {len(metrics)} performance metrics from database")
-
-                if not metrics:
-                    logger.warning("No performance metrics found, showing empty message")
-                    ui.label("No performance data available").classes("text-grey-6")
-                    return
-
-                logger.info(f"Creating charts for {len(metrics)} metrics")
-                # Recreate charts
-                with ui.row().classes("w-full gap-4"):
-                    with ui.column().classes("flex-1"):
-                        duration_fig = create_duration_chart(metrics)
-                        self.duration_plot = ui.plotly(duration_fig).classes("w-full")
-
-                    with ui.column().classes("flex-1"):
-                        token_fig = create_token_chart(metrics)
-                        self.token_plot = ui.plotly(token_fig).classes("w-full")
-
-                # Throughput chart (full width)
-                throughput_fig = create_tokens_per_second_chart(metrics)
-                self.throughput_plot = ui.plotly(throughput_fig).classes("w-full")
-                logger.info("Charts created successfully")
-        else:
+        """Schedule a refresh of the charts with latest data.
+
+        Calls arriving within REFRESH_DEBOUNCE_SECONDS of each other are
+        coalesced into a single redraw. Refreshes still running are superseded,
+        so their results are discarded when they finish.
+        """
+        self._refresh_generation += 1
+        if self._pending_refresh is not None:
+            self._pending_refresh.cancel()
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop (e.g. called from a script): refresh synchronously
+            self._do_refresh()
+            return
+
+        self._pending_refresh = loop.call_later(REFRESH_DEBOUNCE_SECONDS, self._start_refresh)
+
+    def _start_refresh(self) -> None:
+        """Run a debounced refresh as a background task."""
+        self._pending_refresh = None
+        background_tasks.create(
+            self._refresh_async(self._refresh_generation, self.task_id),
+            name="performance_charts_refresh",
+        )
+
+    async def _refresh_async(self, generation: int, task_id: int | None) -> None:
+        """Refresh the charts, building the figures in a worker thread.
+
+        Args:
+            generation: Refresh generation this refresh was scheduled as
+            task_id: Task ID to show metrics for, or None for all tasks
+        """
+        metrics, figures = await asyncio.to_thread(self._prepare, task_id)
+        self._apply_refresh(generation, metrics, figures)
+
+    def _do_refresh(self) -> None:
+        """Refresh the charts synchronously (used when no event loop is running)."""
+        self._pending_refresh = None
+        self._apply_refresh(self._refresh_generation, *self._prepare(self.task_id))
+
+    def _apply_refresh(
+        self, generation: int, metrics: list[dict[str, Any]], figures: ChartFigures | None
+    ) -> None:
+        """Show freshly built figures.
+
+        Existing chart widgets are updated in place; they are only created here
+        if the refresh finishes before the initial load.
+
+        Args:
+            generation: Refresh generation the figures were built for; results of
+                superseded refreshes are discarded
+            metrics: Aggregated performance metrics the figures were built from
+            figures: Duration, token and throughput figures, or None if the
+                metrics are unchanged
+        """
+        logger.debug("PerformanceCharts.refresh() called")
+        if not self.container:
             logger.warning("Container is None, cannot refresh")
+            return
+
+        if generation != self._refresh_generation:
+            logger.debug("Discarding results of a superseded refresh")
+            return
+
+        logger.debug("Retrieved %d performance metrics from database", len(metrics))
+
+        if figures is None:
+            logger.debug("Performance metrics unchanged, skipping redraw")
+            return
+
+        if self._update_charts(figures):
+            self._shown_metrics = metrics
+            logger.debug("Charts updated in place")
+            return
+
+        self._show_charts(metrics, figures)
 
 
 def create_performance_charts(
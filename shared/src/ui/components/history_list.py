@@ -4,6 +4,7 @@ This module provides a UI component for displaying past task execution history.
 Shows task prompts, timestamps, execution counts, and scores.
 """
 
+import functools
 import logging
 from collections.abc import Callable
 from datetime import datetime
@@ -25,6 +26,19 @@ def format_timestamp(timestamp: str | datetime | Any) -> str:
     Returns:
         Formatted string (e.g., "2024-01-15 14:30")
     """
+    if isinstance(timestamp, str | datetime):
+        return _format_timestamp_cached(timestamp)
+    return _format_timestamp_uncached(timestamp)
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_timestamp_cached(timestamp: str | datetime) -> str:
+    """Format a hashable timestamp, reusing the result on history refreshes."""
+    return _format_timestamp_uncached(timestamp)
+
+
+def _format_timestamp_uncached(timestamp: str | datetime | Any) -> str:
+    """Format a timestamp (see format_timestamp)."""
     try:
         # If it's already a datetime object, use it directly
         if isinstance(timestamp, datetime):
@@ -52,6 +66,52 @@ def truncate_prompt(prompt: str, max_length: int = 60) -> str:
     return prompt[: max_length - 3] + "..."
 
 
+# Number of tasks shown per history page
+HISTORY_PAGE_SIZE = 50
+
+# Maximum prompt length shown in the history table
+PROMPT_PREVIEW_LENGTH = 60
+
+# History table columns; sortable columns are sorted by the database
+HISTORY_COLUMNS: list[dict[str, Any]] = [
+    {
+        "name": "id",
+        "label": "ID",
+        "field": "id",
+        "align": "center",
+        "sortable": True,
+    },
+    {
+        "name": "prompt",
+        "label": "Task Prompt",
+        "field": "prompt",
+        "align": "left",
+        "sortable": False,
+    },
+    {
+        "name": "submitted_at",
+        "label": "Submitted",
+        "field": "submitted_at",
+        "align": "center",
+        "sortable": True,
+    },
+    {
+        "name": "execution_count",
+        "label": "Executions",
+        "field": "execution_count",
+        "align": "center",
+        "sortable": True,
+    },
+    {
+        "name": "highest_score",
+        "label": "Best Score",
+        "field": "highest_score",
+        "align": "center",
+        "sortable": True,
+    },
+]
+
+
 class HistoryList:
     """History list component.
 
@@ -82,84 +142,43 @@ class HistoryList:
 
             self._render_history()
 
+    @ui.refreshable_method
     def _render_history(self) -> None:
-        """Render history table."""
-        # Query history data
-        history_entries = self.repository.get_task_history()
-        logger.info(f"_render_history: Rendering {len(history_entries)} history entries")
+        """Render history table.
+
+        Only the current page of tasks is queried and formatted; the table
+        requests further pages from the server as the user pages or sorts.
+        """
+        self.table = None
+        total = self.repository.count_tasks()
+        logger.info("_render_history: %d history entries in database", total)
 
-        if not history_entries:
+        if total == 0:
             logger.info("_render_history: No history entries found")
             ui.label("No task execution history yet").classes("text-grey-6")
             ui.label("Execute a task to get started!").classes("text-caption text-grey-7")
             return
 
-        # Define table columns
-        columns = [
-            {
-                "name": "id",
-                "label": "ID",
-                "field": "id",
-                "align": "center",
-                "sortable": True,
-            },
-            {
-                "name": "prompt",
-                "label": "Task Prompt",
-                "field": "prompt",
-                "align": "left",
-                "sortable": False,
-            },
-            {
-                "name": "submitted_at",
-                "label": "Submitted",
-                "field": "submitted_at",
-                "align": "center",
-                "sortable": True,
-            },
-            {
-                "name": "execution_count",
-                "label": "Executions",
-                "field": "execution_count",
-                "align": "center",
-                "sortable": True,
-            },
-            {
-                "name": "highest_score",
-                "label": "Best Score",
-                "field": "highest_score",
-                "align": "center",
-                "sortable": True,
-            },
-        ]
-
-        # Prepare table rows
-        rows = []
-        for entry in history_entries:
-            task_id = cast(int, entry["id"])
-            prompt = cast(str, entry["prompt"])
-            submitted_at = cast(str, entry["submitted_at"])
-            execution_count = cast(int, entry["execution_count"])
-            highest_score = entry["highest_score"]  # Can be None
-
-            rows.append(
-                {
-                    "id": task_id,
-                    "prompt": truncate_prompt(prompt),
-                    "submitted_at": format_timestamp(submitted_at),
-                    "execution_count": execution_count,
-                    "highest_score": highest_score if highest_score is not None else "N/A",
-                }
-            )
+        pagination: dict[str, Any] = {
+            "page": 1,
+            "rowsPerPage": HISTORY_PAGE_SIZE,
+            "sortBy": "submitted_at",
+            "descending": True,
+            "rowsNumber": total,
+        }
 
         # Create table
         self.table = ui.table(
-            columns=columns,
-            rows=rows,
+            columns=HISTORY_COLUMNS,
+            rows=self._load_page(pagination),
             row_key="id",
             selection="single",
+            pagination=pagination,
         ).classes("w-full")
 
+        # Serve pages on demand (server-side pagination and sorting)
+        self.table.on("request", self._on_request, ["pagination"])
+
         # Handle row selection
         if self.on_task_select:
 
@@ -174,22 +193,88 @@ class HistoryList:
 
             self.table.on("selection", on_selection)
 
+    def _load_page(self, pagination: dict[str, Any]) -> list[dict[str, Any]]:
+        """Query and format the rows of one history page.
+
+        Args:
+            pagination: Quasar pagination state (page, rowsPerPage, sortBy, descending)
+
+        Returns:
+            Table rows of the requested page
+        """
+        rows_per_page = int(pagination.get("rowsPerPage") or HISTORY_PAGE_SIZE)
+        page = max(int(pagination.get("page") or 1), 1)
+        sort_by = pagination.get("sortBy") or "submitted_at"
+        descending = bool(pagination.get("descending", True))
+
+        history_entries = self.repository.get_task_history(
+            limit=rows_per_page,
+            offset=(page - 1) * rows_per_page,
+            sort_by=sort_by,
+            descending=descending,
+            prompt_preview_length=PROMPT_PREVIEW_LENGTH,
+        )
+
+        rows = []
+        for entry in history_entries:
+            task_id = cast(int, entry["id"])
+            prompt = cast(str, entry["prompt"])
+            submitted_at = cast(str, entry["submitted_at"])
+            execution_count = cast(int, entry["execution_count"])
+            highest_score = entry["highest_score"]  # Can be None
+
+            rows.append(
+                {
+                    "id": task_id,
+                    "prompt": prompt,  # Already truncated by the query
+                    "submitted_at": format_timestamp(submitted_at),
+                    "execution_count": execution_count,
+                    "highest_score": highest_score if highest_score is not None else "N/A",
+                }
+            )
+
+        return rows
+
+    def _on_request(self, e: Any) -> None:
+        """Load the page requested by the table (page change or sort).
+
+        Args:
+            e: Table request event carrying the new pagination state
+        """
+        if self.table is not None:
+            self._show_page(dict(e.args["pagination"]))
+
+    def _show_page(self, pagination: dict[str, Any]) -> bool:
+        """Replace the table rows with a page of the history.
+
+        Args:
+            pagination: Quasar pagination state of the page to show
+
+        Returns:
+            True if the page was shown, False if the table has to be rebuilt
+            (no table yet, or no tasks left)
+        """
+        total = self.repository.count_tasks()
+        if self.table is None or total == 0:
+            return False
+
+        pagination["rowsNumber"] = total
+        self.table.rows = self._load_page(pagination)
+        self.table.pagination = pagination
+        return True
+
     def refresh(self) -> None:
-        """Refresh the history list."""
+        """Refresh the history list.
+
+        The current page is reloaded in place; the table is only rebuilt when
+        switching between the empty state and the table.
+        """
         logger.info("HistoryList.refresh() called")
         if not self.container:
             logger.warning("HistoryList container is None, cannot refresh")
             return
 
-        # Query history data first to check if there's new data
-        history_entries = self.repository.get_task_history()
-        logger.info(f"Found {len(history_entries)} history entries in database")
-
-        # Clear table reference
-        self.table = None
+        if self.table is not None and self._show_page(dict(self.table.pagination)):
+            return
 
-        # Clear and re-render
-        self.container.clear()
-        with self.container:
-            ui.label("Task Execution History").classes("text-h6")
-            self._render_history()
+        self._render_history.refresh()
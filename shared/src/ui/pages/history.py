@@ -19,6 +19,17 @@ class HistoryPage:
     Displays past task executions and their historical leaderboards.
     """
 
+    __slots__ = (
+        "config",
+        "db",
+        "repository",
+        "history_list",
+        "leaderboard",
+        "leaderboard_container",
+        "_task_label",
+        "current_task_id",
+    )
+
     def __init__(self, config: AppConfig, db: DatabaseConnection):
         """Initialize history page.
 
@@ -32,6 +43,7 @@ class HistoryPage:
         self.history_list: HistoryList | None = None
         self.leaderboard: LeaderboardTable | None = None
         self.leaderboard_container: ui.card | None = None
+        self._task_label: ui.label | None = None
         self.current_task_id: int | None = None
 
     def create(self) -> None:
@@ -58,25 +70,37 @@ class HistoryPage:
     def _on_task_select(self, task_id: int) -> None:
         """Handle task selection from history list.
 
+        The leaderboard is built on the first selection; later selections
+        update it in place. Re-selecting the current task does nothing.
+
         Args:
             task_id: ID of selected task
         """
+        if task_id == self.current_task_id:
+            return
         self.current_task_id = task_id
 
-        # Clear and rebuild leaderboard container
-        if self.leaderboard_container:
+        if not self.leaderboard_container:
+            return
+
+        # Get task info
+        task = self.repository.get_task(task_id)
+
+        if self.leaderboard is None or self._task_label is None:
+            # Replace the placeholder with the task caption and leaderboard
             self.leaderboard_container.clear()
             with self.leaderboard_container:
                 ui.label("Historical Leaderboard").classes("text-h6")
-
-                # Get task info
-                task = self.repository.get_task(task_id)
-                if task:
-                    ui.label(f"Task #{task_id}: {task.prompt}").classes("text-caption text-grey-7")
+                self._task_label = ui.label().classes("text-caption text-grey-7")
 
                 # Render leaderboard for selected task
                 self.leaderboard = LeaderboardTable(repository=self.repository, task_id=task_id)
                 self.leaderboard.create()
+        else:
+            self.leaderboard.update_task(task_id)
+
+        self._task_label.set_text(f"Task #{task_id}: {task.prompt}" if task else "")
+        self._task_label.set_visibility(task is not None)
 
     def refresh(self) -> None:
         """Refresh the history page with latest data."""
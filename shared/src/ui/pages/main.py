@@ -3,24 +3,29 @@
 This module provides the main UI page for task submission and execution.
 """
 
+import asyncio
 import contextlib
 import logging
+from typing import Literal
 
-from nicegui import ui
+from nicegui import Client, ui
+from pydantic_ai import Agent
 
 from src.agents.eval_agent import create_evaluation_agent
 from src.agents.task_agent import create_task_agents_from_config
-from src.config.models import AppConfig
+from src.config.models import AppConfig, EvaluationConfig, ModelConfig
 from src.database.connection import DatabaseConnection
 from src.database.repositories import TaskRepository
-from src.execution.evaluator import evaluate_execution, extract_agent_response
+from src.execution.evaluator import score_agent_response
 from src.execution.executor import execute_multi_agent
 from src.execution.state import MultiAgentExecutionState
+from src.models.evaluation import EvaluationResult
 from src.models.execution import AgentExecution
 from src.models.task import TaskSubmission
 from src.ui.components.agent_responses import (
     AgentResponsesPanel,
     create_agent_responses_panel,
+    get_agent_response,
 )
 from src.ui.components.input_form import create_task_input_form
 from src.ui.components.leaderboard import LeaderboardTable, create_leaderboard_table
@@ -32,6 +37,11 @@ from src.ui.components.tool_tree import ToolCallTreePanel, create_tool_call_tree
 
 logger = logging.getLogger(__name__)
 
+# Notifications queued within this window are sent together (see MainPage._notify)
+NOTIFY_COALESCE_SECONDS = 0.1
+
+NotifyType = Literal["positive", "negative", "warning", "info"]
+
 
 class MainPage:
     """Main page controller for task execution.
@@ -57,7 +67,101 @@ class MainPage:
         self.current_task_id: int | None = None
         self.current_executions: list[AgentExecution] = []
         self.execution_scores: dict[int, int] = {}  # execution_id -> score mapping
-        self.is_executing = False
+        # Held while a task executes; a second submission is rejected meanwhile
+        self._exec_lock = asyncio.Lock()
+        # Shared by the task agent and evaluation phases to cap concurrent LLM calls
+        self._llm_sem = asyncio.Semaphore(config.execution.max_concurrency)
+        # Agents built for the config objects they were created from (see _get_task_agents)
+        self._task_agents: tuple[list[ModelConfig], list[Agent]] | None = None
+        self._eval_agent: tuple[EvaluationConfig, Agent] | None = None
+        # Running execute_task() call, cancelled when the client disconnects
+        self._current_task: asyncio.Task[None] | None = None
+        # Notification messages waiting for _flush_notifies(), by notification type
+        self._pending_notifies: dict[NotifyType, list[str]] = {}
+        self._notify_handle: asyncio.TimerHandle | None = None
+
+    def _get_task_agents(self) -> list[Agent]:
+        """Get the task agents for the current configuration.
+
+        Agents are stateless between runs, so they are built once and reused
+        across submissions until config.task_agents is replaced.
+
+        Returns:
+            List of configured Pydantic AI Agents
+
+        Raises:
+            ValueError: If any configuration is invalid or API keys are missing
+        """
+        if self._task_agents is None or self._task_agents[0] is not self.config.task_agents:
+            agents = create_task_agents_from_config(self.config.task_agents)
+            self._task_agents = (self.config.task_agents, agents)
+        return self._task_agents[1]
+
+    def _get_eval_agent(self) -> Agent:
+        """Get the evaluation agent for the current configuration.
+
+        Returns:
+            Configured evaluation agent, reused until config.evaluation_agent is replaced
+
+        Raises:
+            ValueError: If configuration is invalid or API key is missing
+        """
+        if self._eval_agent is None or self._eval_agent[0] is not self.config.evaluation_agent:
+            agent = create_evaluation_agent(self.config.evaluation_agent)
+            self._eval_agent = (self.config.evaluation_agent, agent)
+        return self._eval_agent[1]
+
+    def _notify(self, message: str, type: NotifyType = "info") -> None:
+        """Queue a notification for the current client.
+
+        Messages of the same type queued within NOTIFY_COALESCE_SECONDS are
+        shown as one notification and duplicates are dropped, so a burst of
+        evaluation failures doesn't flood the browser with toasts.
+
+        Args:
+            message: Notification text
+            type: Notification type
+        """
+        if self._notify_handle is None:
+            try:
+                client = ui.context.client
+            except RuntimeError:
+                # Not running inside a page (nothing to notify)
+                return
+            self._notify_handle = asyncio.get_running_loop().call_later(
+                NOTIFY_COALESCE_SECONDS, self._flush_notifies, client
+            )
+
+        messages = self._pending_notifies.setdefault(type, [])
+        if message not in messages:
+            messages.append(message)
+
+    def _flush_notifies(self, client: Client) -> None:
+        """Show the queued notifications, one per notification type.
+
+        Args:
+            client: Client the notifications were queued for
+        """
+        self._notify_handle = None
+        pending, self._pending_notifies = self._pending_notifies, {}
+
+        for notify_type, messages in pending.items():
+            # The client may have disconnected in the meantime
+            with contextlib.suppress(Exception), client:
+                if len(messages) == 1:
+                    ui.notify(messages[0], type=notify_type)
+                else:
+                    ui.notify(
+                        "\n".join(messages),
+                        type=notify_type,
+                        multi_line=True,
+                        classes="whitespace-pre-line",
+                    )
+
+    @property
+    def is_executing(self) -> bool:
+        """Whether a task is currently being executed."""
+        return self._exec_lock.locked()
 
     async def execute_task(self, prompt: str) -> None:
         """Execute a task with multiple agents.
@@ -67,139 +171,208 @@ class MainPage:
         """
         logger.info(f"execute_task called with prompt: {prompt[:50]}...")
 
-        if self.is_executing:
+        if self._exec_lock.locked():
             logger.warning("Execution already in progress, skipping")
-            with contextlib.suppress(Exception):
-                ui.notify("An execution is already in progress", type="warning")
+            self._notify("An execution is already in progress", type="warning")
             return
 
-        self.is_executing = True
-        logger.info("Starting task execution")
-
-        try:
-            # Create task submission
-            task = TaskSubmission(prompt=prompt)
-            task_id = self.repository.create_task(task)
+        async with self._exec_lock:
+            logger.info("Starting task execution")
 
-            with contextlib.suppress(Exception):
-                ui.notify(f"Task submitted (ID: {task_id})", type="positive")
+            try:
+                # Create task submission
+                task = TaskSubmission(prompt=prompt)
+                # Repository calls block on DuckDB, so keep them off the event loop
+                task_id = await asyncio.to_thread(self.repository.create_task, task)
+
+                self._notify(f"Task submitted (ID: {task_id})", type="positive")
+
+                # Reuse the execution state tracker of the previous submission
+                execution_state = self.current_execution_state
+                if execution_state is None:
+                    execution_state = MultiAgentExecutionState(task_id=task_id)
+                    self.current_execution_state = execution_state
+                else:
+                    execution_state.reset(task_id)
+
+                # Add agents to state
+                for model_config in self.config.task_agents:
+                    execution_state.add_agent(model_config.provider, model_config.model)
+
+                # Update status display
+                if self.status_display:
+                    self.status_display.update_state(execution_state)
+
+                evaluation_agent = self._get_eval_agent()
+                self.execution_scores = {}  # Reset scores for this task
+
+                async def _evaluate_one(execution: AgentExecution) -> tuple[int, str] | None:
+                    # Use the response captured at execution time, parse messages otherwise
+                    agent_response = get_agent_response(execution)
+                    if not agent_response:
+                        return None
+                    # Scored before the execution is saved, so there is no ID to attach yet
+                    async with self._llm_sem:
+                        return await score_agent_response(
+                            prompt, agent_response, evaluation_agent, timeout_seconds=30.0
+                        )
 
-            # Create execution state tracker
-            self.current_execution_state = MultiAgentExecutionState(task_id=task_id)
+                # (execution, score and explanation) tasks in completion order, started
+                # while slower agents still run
+                evaluation_tasks: list[tuple[AgentExecution, asyncio.Task[tuple[int, str] | None]]]
+                evaluation_tasks = []
 
-            # Add agents to state
-            for model_config in self.config.task_agents:
-                self.current_execution_state.add_agent(model_config.provider, model_config.model)
+                async def on_agent_done(execution: AgentExecution) -> None:
+                    # Show each agent's outcome as soon as it finishes
+                    model_identifier = execution.model_identifier
+                    execution_state.update_status(model_identifier, execution.status)
+                    if self.status_display:
+                        self.status_display.patch_row(model_identifier, execution.status)
+                    evaluation_tasks.append(
+                        (execution, asyncio.create_task(_evaluate_one(execution)))
+                    )
 
-            # Update status display
-            if self.status_display:
-                self.status_display.update_state(self.current_execution_state)
+                # Create agents (reused across submissions)
+                agents = self._get_task_agents()
 
-            # Create agents
-            agents = create_task_agents_from_config(self.config.task_agents)
+                try:
+                    # Execute agents in parallel
+                    executions = await execute_multi_agent(
+                        agents=agents,
+                        model_configs=self.config.task_agents,
+                        prompt=prompt,
+                        task_id=task_id,
+                        timeout_seconds=self.config.execution.timeout_seconds,
+                        semaphore=self._llm_sem,
+                        on_agent_done=on_agent_done,
+                    )
+
+                    # Save execution results to database in one transaction
+                    execution_ids = await asyncio.to_thread(
+                        self.repository.create_executions, executions
+                    )
+                    for execution, execution_id in zip(executions, execution_ids, strict=True):
+                        execution.id = execution_id
+
+                    # Show completion notification
+                    completed = execution_state.get_completed_count()
+                    failed = execution_state.get_failed_count()
+                    total = len(self.config.task_agents)
+
+                    self._notify(
+                        f"Execution complete: {completed}/{total} succeeded, "
+                        f"{failed}/{total} failed",
+                        type="positive" if completed > 0 else "warning",
+                    )
+
+                    # Wait for the remaining evaluations
+                    self._notify("Running evaluations...", type="info")
+
+                    results = await asyncio.gather(
+                        *(pending for _, pending in evaluation_tasks), return_exceptions=True
+                    )
+                except BaseException:
+                    # Don't leave evaluations running for a failed or cancelled execution
+                    for _, pending in evaluation_tasks:
+                        pending.cancel()
+                    raise
+
+                # Report problems back on this coroutine and collect the evaluations
+                evaluation_rows: list[dict[str, object]] = []
+                for (execution, _), result in zip(evaluation_tasks, results, strict=True):
+                    model_id = execution.model_identifier
+                    if isinstance(result, BaseException):
+                        self._notify(
+                            f"Evaluation failed for {model_id}: {result}",
+                            type="warning",
+                        )
+                    elif result is None:
+                        self._notify(f"No agent response found for {model_id}", type="warning")
+                    elif execution.id is not None:
+                        score, explanation = result
+                        evaluation_rows.append(
+                            {
+                                "execution_id": execution.id,
+                                "score": score,
+                                "explanation": explanation,
+                            }
+                        )
 
-            # Execute agents in parallel
-            executions = await execute_multi_agent(
-                agents=agents,
-                model_configs=self.config.task_agents,
-                prompt=prompt,
-                task_id=task_id,
-                timeout_seconds=self.config.execution.timeout_seconds,
-            )
+                # Save evaluations to database in one transaction
+                try:
+                    evaluations = EvaluationResult.bulk_create(evaluation_rows)
+                    await asyncio.to_thread(self.repository.create_evaluations, evaluations)
+                except Exception as e:
+                    logger.error(f"Failed to save evaluations: {e}", exc_info=True)
+                    self._notify(f"Failed to save evaluations: {e}", type="warning")
+                else:
+                    # Store score mapping for UI display
+                    for evaluation in evaluations:
+                        self.execution_scores[evaluation.execution_id] = evaluation.score
 
-            # Save execution results to database
-            for execution in executions:
-                execution_id = self.repository.create_execution(execution)
-                execution.id = execution_id
+                self._notify("Evaluations complete!", type="positive")
 
-                # Update state
-                model_identifier = f"{execution.model_provider}/{execution.model_name}"
-                self.current_execution_state.update_status(model_identifier, execution.status)
+                # Store current task and executions
+                self.current_task_id = task_id
+                self.current_executions = executions
 
-            # Update status display with final results
-            if self.status_display:
-                self.status_display.update_state(self.current_execution_state)
+                # Refresh leaderboard
+                if self.leaderboard:
+                    self.leaderboard.update_task(task_id)
 
-            # Show completion notification
-            completed = self.current_execution_state.get_completed_count()
-            failed = self.current_execution_state.get_failed_count()
-            total = len(self.config.task_agents)
+                # Refresh tool tree panel
+                if self.tool_tree_panel:
+                    self.tool_tree_panel.update_executions(executions)
 
-            with contextlib.suppress(Exception):
-                ui.notify(
-                    f"Execution complete: {completed}/{total} succeeded, {failed}/{total} failed",
-                    type="positive" if completed > 0 else "warning",
-                )
+                # Refresh agent responses panel
+                if self.agent_responses_panel:
+                    self.agent_responses_panel.update_executions(executions, self.execution_scores)
 
-            # Run evaluations
-            with contextlib.suppress(Exception):
-                ui.notify("Running evaluations...", type="info")
+            except Exception as e:
+                logger.error(f"Execution failed: {e}", exc_info=True)
+                self._notify(f"Execution failed: {str(e)}", type="negative")
 
-            evaluation_agent = create_evaluation_agent(self.config.evaluation_agent)
-            self.execution_scores = {}  # Reset scores for this task
+            logger.info("Task execution completed")
 
-            for execution in executions:
-                try:
-                    # Extract agent response from execution
-                    agent_response = extract_agent_response(execution.all_messages_json)
-
-                    if agent_response:
-                        evaluation = await evaluate_execution(
-                            execution,
-                            prompt,
-                            agent_response,
-                            evaluation_agent,
-                            timeout_seconds=30.0,
-                        )
-                        # Save evaluation to database
-                        self.repository.create_evaluation(evaluation)
-                        # Store score mapping for UI display
-                        if execution.id:
-                            self.execution_scores[execution.id] = evaluation.score
-                    else:
-                        model_id = f"{execution.model_provider}/{execution.model_name}"
-                        with contextlib.suppress(Exception):
-                            ui.notify(
-                                f"No agent response found for {model_id}",
-                                type="warning",
-                            )
-                except Exception as e:
-                    model_id = f"{execution.model_provider}/{execution.model_name}"
-                    with contextlib.suppress(Exception):
-                        ui.notify(
-                            f"Evaluation failed for {model_id}: {e}",
-                            type="warning",
-                        )
+    async def submit(self, prompt: str) -> None:
+        """Run execute_task() as a tracked task that can be cancelled.
 
-            with contextlib.suppress(Exception):
-                ui.notify("Evaluations complete!", type="positive")
+        Args:
+            prompt: Task prompt to execute
+        """
+        if self._current_task is not None:
+            # execute_task() rejects the overlapping submission with a warning
+            await self.execute_task(prompt)
+            return
 
-            # Store current task and executions
-            self.current_task_id = task_id
-            self.current_executions = executions
+        task = asyncio.create_task(self.execute_task(prompt), name=f"execute-task-{id(self)}")
+        task.add_done_callback(self._on_task_done)
+        self._current_task = task
+        await task
 
-            # Refresh leaderboard
-            if self.leaderboard:
-                self.leaderboard.update_task(task_id)
+    def _on_task_done(self, task: asyncio.Task[None]) -> None:
+        """Forget a finished execution and log how it ended.
 
-            # Refresh tool tree panel
-            if self.tool_tree_panel:
-                self.tool_tree_panel.update_executions(executions)
+        Args:
+            task: The finished execute_task() task
+        """
+        if self._current_task is task:
+            self._current_task = None
 
-            # Refresh agent responses panel
-            if self.agent_responses_panel:
-                self.agent_responses_panel.update_executions(executions, self.execution_scores)
+        if task.cancelled():
+            logger.info("Task execution cancelled")
+        elif (error := task.exception()) is not None:
+            logger.error(f"Task execution crashed: {error}", exc_info=error)
 
-        except Exception as e:
-            logger.error(f"Execution failed: {e}", exc_info=True)
-            try:
-                ui.notify(f"Execution failed: {str(e)}", type="negative")
-            except Exception as notify_error:
-                logger.error(f"Failed to show notification: {notify_error}")
+    def cancel(self) -> None:
+        """Cancel the running execution, if any.
 
-        finally:
-            logger.info("Task execution completed, resetting is_executing flag")
-            self.is_executing = False
+        Called when the client disconnects so that closing the tab stops the
+        pending LLM calls instead of paying for results nobody will see.
+        """
+        if self._current_task is not None and not self._current_task.done():
+            logger.info("Cancelling task execution")
+            self._current_task.cancel()
 
     def create(self) -> None:
         """Create the main page UI."""
@@ -217,10 +390,8 @@ Agents can use the following 3 tools:
             """)
 
         # Task input form
-        async def handle_submit(prompt: str) -> None:
-            await self.execute_task(prompt)
-
-        create_task_input_form(on_submit=handle_submit)
+        create_task_input_form(on_submit=self.submit)
+        ui.context.client.on_disconnect(self.cancel)
 
         # Execution status display
         self.status_display = create_execution_status_display(self.current_execution_state)
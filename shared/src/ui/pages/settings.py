@@ -89,7 +89,7 @@ class SettingsPage:
         # Reload form with original config
         if self.form and self.form.task_agents_container:
             # Clear existing forms
-            for form in list(self.form.task_agent_forms):
+            for form in self.form.task_agent_forms.values():
                 if form.container:
                     form.container.delete()
             self.form.task_agent_forms.clear()
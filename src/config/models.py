@@ -49,9 +49,11 @@ class ExecutionConfig(BaseModel):
 
     Attributes:
         timeout_seconds: Maximum execution time per agent (1-600 seconds)
+        max_concurrency: Maximum number of LLM calls (task agents and evaluations) in flight
     """
 
     timeout_seconds: int = Field(default=60, ge=1, le=600)
+    max_concurrency: int = Field(default=5, ge=1)
 
 
 class EvaluationConfig(BaseModel):
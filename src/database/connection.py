@@ -4,29 +4,66 @@ This module provides connection management for DuckDB and handles
 database schema initialization and migration.
 """
 
+import queue
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
 import duckdb
 
 from .schema import ALL_DDL_STATEMENTS, SCHEMA_VERSION
 
+# Maximum number of pooled connections handed out by DatabaseConnection.acquire()
+DEFAULT_POOL_SIZE = 4
+
 
 class DatabaseConnection:
     """Manages DuckDB database connection and initialization.
 
+    Besides the primary connection returned by connect(), a small pool of
+    connections to the same database is available through acquire(). Pooled
+    connections are DuckDB cursors of the primary connection, so they also work
+    for in-memory databases and can be used concurrently from worker threads.
+    Repositories borrow one per operation, so a write does not block reads.
+
+    Each pooled connection has its own transaction and its own temporary
+    objects: TEMP tables, views and prepared statements created through one
+    connection are invisible to the others, and a connection may be handed to
+    a different caller next time. Keep such objects within a single acquire()
+    block, or use persistent objects.
+
     Attributes:
         db_path: Path to the DuckDB database file
         conn: Active DuckDB connection
+        pool_size: Maximum number of pooled connections
+        data_version: Counter incremented by mark_changed() after every write,
+            used by readers to tell whether cached query results are stale
     """
 
-    def __init__(self, db_path: str | Path) -> None:
+    def __init__(self, db_path: str | Path, pool_size: int = DEFAULT_POOL_SIZE) -> None:
         """Initialize database connection.
 
         Args:
             db_path: Path to the DuckDB database file
+            pool_size: Maximum number of pooled connections handed out by acquire()
+
+        Raises:
+            ValueError: If pool_size is less than 1
         """
+        if pool_size < 1:
+            raise ValueError(f"pool_size must be at least 1, got {pool_size}")
+
         self.db_path = Path(db_path)
         self.conn: duckdb.DuckDBPyConnection | None = None
+        self.pool_size = pool_size
+        # Idle pooled connections; None only wakes up a caller waiting in _checkout()
+        self._pool: queue.Queue[duckdb.DuckDBPyConnection | None] = queue.Queue()
+        # Every pooled connection created since the last close(), idle or in use
+        self._pool_connections: set[duckdb.DuckDBPyConnection] = set()
+        self._pool_lock = threading.Lock()
+        self.data_version = 0
+        self._version_lock = threading.Lock()
 
     def connect(self) -> duckdb.DuckDBPyConnection:
         """Establish connection to the database.
@@ -41,8 +78,92 @@ class DatabaseConnection:
             self.conn = duckdb.connect(str(self.db_path))
         return self.conn
 
+    @contextmanager
+    def acquire(self) -> Iterator[duckdb.DuckDBPyConnection]:
+        """Borrow a pooled connection for the duration of a ``with`` block.
+
+        Connections are created lazily up to pool_size; when all are in use the
+        caller blocks until one is returned. A connection still borrowed when
+        close() is called is discarded when returned instead of being reused.
+
+        Yields:
+            DuckDB connection to the same database as connect()
+
+        Raises:
+            duckdb.Error: If a new connection cannot be created
+        """
+        conn = self._checkout()
+        try:
+            yield conn
+        finally:
+            self._release(conn)
+
+    def _checkout(self) -> duckdb.DuckDBPyConnection:
+        """Take an idle pooled connection, creating one if the pool is not full.
+
+        Returns:
+            DuckDB connection reserved for the caller
+        """
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            conn = None
+        if conn is not None:
+            return conn
+
+        while True:
+            with self._pool_lock:
+                if len(self._pool_connections) < self.pool_size:
+                    conn = self.connect().cursor()
+                    self._pool_connections.add(conn)
+                    return conn
+
+            conn = self._pool.get()
+            if conn is not None:
+                return conn
+
+    def _release(self, conn: duckdb.DuckDBPyConnection) -> None:
+        """Return a borrowed connection to the pool.
+
+        Connections created before the last close() are closed and dropped;
+        a waiting caller is woken up to create a replacement instead.
+
+        Args:
+            conn: Connection obtained from _checkout()
+        """
+        with self._pool_lock:
+            if conn in self._pool_connections:
+                self._pool.put(conn)
+                return
+
+        conn.close()
+        self._pool.put(None)
+
+    def mark_changed(self) -> None:
+        """Record that the database contents were modified.
+
+        Repositories call this after committing a write so that cached query
+        results keyed on data_version are recomputed.
+        """
+        with self._version_lock:
+            self.data_version += 1
+
     def close(self) -> None:
-        """Close the database connection."""
+        """Close pooled connections and the database connection.
+
+        Connections still borrowed through acquire() are closed as well; they
+        are dropped from the pool when returned.
+        """
+        with self._pool_lock:
+            while True:
+                try:
+                    self._pool.get_nowait()
+                except queue.Empty:
+                    break
+            for conn in self._pool_connections:
+                conn.close()
+            self._pool_connections.clear()
+
         if self.conn is not None:
             self.conn.close()
             self.conn = None
@@ -4,11 +4,21 @@ This module provides repository pattern implementation for
 database operations on tasks, executions, and evaluations.
 """
 
+import duckdb
+
 from src.database.connection import DatabaseConnection
 from src.models.evaluation import EvaluationResult
 from src.models.execution import AgentExecution
 from src.models.task import TaskSubmission
 
+# Sortable task history columns (public name -> SQL expression)
+_HISTORY_SORT_COLUMNS = {
+    "id": "t.id",
+    "submitted_at": "t.submitted_at",
+    "execution_count": "execution_count",
+    "highest_score": "highest_score",
+}
+
 
 class TaskRepository:
     """Repository for task and execution management.
@@ -24,6 +34,17 @@ class TaskRepository:
             db: DatabaseConnection instance
         """
         self.db = db
+        # task_id -> (data_version, metrics); see get_performance_metrics()
+        self._metrics_cache: dict[int | None, tuple[int, list[dict[str, object]]]] = {}
+
+    @property
+    def data_version(self) -> int:
+        """Version of the database contents, incremented by every write.
+
+        Callers can compare it with a version they saw earlier to tell whether
+        data they derived from the database may be stale.
+        """
+        return self.db.data_version
 
     def create_task(self, task: TaskSubmission) -> int:
         """Create a new task submission in the database.
@@ -37,19 +58,19 @@ class TaskRepository:
         Raises:
             Exception: If database operation fails
         """
-        conn = self.db.connect()
+        with self.db.acquire() as conn:
+            cursor = conn.execute(
+                "INSERT INTO task_submissions (prompt, submitted_at) VALUES (?, ?) RETURNING id",
+                [task.prompt, task.submitted_at],
+            )
 
-        cursor = conn.execute(
-            "INSERT INTO task_submissions (prompt, submitted_at) VALUES (?, ?) RETURNING id",
-            [task.prompt, task.submitted_at],
-        )
+            result = cursor.fetchone()
+            if result is None:
+                raise RuntimeError("Failed to create task: no ID returned")
 
-        result = cursor.fetchone()
-        if result is None:
-            raise RuntimeError("Failed to create task: no ID returned")
-
-        task_id: int = result[0]
-        conn.commit()
+            task_id: int = result[0]
+            conn.commit()
+        self.db.mark_changed()
 
         return task_id
 
@@ -65,8 +86,59 @@ class TaskRepository:
         Raises:
             Exception: If database operation fails
         """
-        conn = self.db.connect()
+        with self.db.acquire() as conn:
+            execution_id = self._insert_execution(conn, execution)
+            conn.commit()
+        self.db.mark_changed()
+
+        return execution_id
+
+    def create_executions(self, executions: list[AgentExecution]) -> list[int]:
+        """Create multiple agent execution records in a single transaction.
+
+        Persisting all results of a multi-agent run together pays the commit
+        cost once instead of once per agent.
+
+        Args:
+            executions: AgentExecution instances to persist
 
+        Returns:
+            Database IDs of the created executions, in the same order as given
+
+        Raises:
+            Exception: If database operation fails (no rows are persisted)
+        """
+        if not executions:
+            return []
+
+        with self.db.acquire() as conn:
+            conn.begin()
+            try:
+                execution_ids = [
+                    self._insert_execution(conn, execution) for execution in executions
+                ]
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+        self.db.mark_changed()
+        return execution_ids
+
+    @staticmethod
+    def _insert_execution(conn: duckdb.DuckDBPyConnection, execution: AgentExecution) -> int:
+        """Insert an agent execution row without committing.
+
+        Args:
+            conn: Database connection to execute on
+            execution: AgentExecution instance to persist
+
+        Returns:
+            Database ID of the inserted execution
+
+        Raises:
+            RuntimeError: If no ID is returned
+        """
         cursor = conn.execute(
             """
             INSERT INTO agent_executions
@@ -93,8 +165,6 @@ class TaskRepository:
             raise RuntimeError("Failed to create execution: no ID returned")
 
         execution_id: int = result[0]
-        conn.commit()
-
         return execution_id
 
     def update_execution_result(self, execution: AgentExecution) -> None:
@@ -110,29 +180,29 @@ class TaskRepository:
         if execution.id is None:
             raise ValueError("Execution must have an ID to be updated")
 
-        conn = self.db.connect()
-
-        conn.execute(
-            """
-            UPDATE agent_executions
-            SET status = ?,
-                completed_at = ?,
-                duration_seconds = ?,
-                token_count = ?,
-                all_messages = ?
-            WHERE id = ?
-            """,
-            [
-                execution.status.value,
-                execution.completed_at,
-                execution.duration_seconds,
-                execution.token_count,
-                execution.all_messages_json,
-                execution.id,
-            ],
-        )
+        with self.db.acquire() as conn:
+            conn.execute(
+                """
+                UPDATE agent_executions
+                SET status = ?,
+                    completed_at = ?,
+                    duration_seconds = ?,
+                    token_count = ?,
+                    all_messages = ?
+                WHERE id = ?
+                """,
+                [
+                    execution.status.value,
+                    execution.completed_at,
+                    execution.duration_seconds,
+                    execution.token_count,
+                    execution.all_messages_json,
+                    execution.id,
+                ],
+            )
 
-        conn.commit()
+            conn.commit()
+        self.db.mark_changed()
 
     def get_task(self, task_id: int) -> TaskSubmission | None:
         """Retrieve a task by ID.
@@ -143,12 +213,11 @@ class TaskRepository:
         Returns:
             TaskSubmission instance if found, None otherwise
         """
-        conn = self.db.connect()
-
-        result = conn.execute(
-            "SELECT id, prompt, submitted_at FROM task_submissions WHERE id = ?",
-            [task_id],
-        ).fetchone()
+        with self.db.acquire() as conn:
+            result = conn.execute(
+                "SELECT id, prompt, submitted_at FROM task_submissions WHERE id = ?",
+                [task_id],
+            ).fetchone()
 
         if not result:
             return None
@@ -164,16 +233,15 @@ class TaskRepository:
         Returns:
             AgentExecution instance if found, None otherwise
         """
-        conn = self.db.connect()
-
-        result = conn.execute(
-            """
-            SELECT id, task_id, model_provider, model_name, status,
-                   started_at, completed_at, duration_seconds, token_count, all_messages
-            FROM agent_executions WHERE id = ?
-            """,
-            [execution_id],
-        ).fetchone()
+        with self.db.acquire() as conn:
+            result = conn.execute(
+                """
+                SELECT id, task_id, model_provider, model_name, status,
+                       started_at, completed_at, duration_seconds, token_count, all_messages
+                FROM agent_executions WHERE id = ?
+                """,
+                [execution_id],
+            ).fetchone()
 
         if not result:
             return None
@@ -200,18 +268,17 @@ class TaskRepository:
         Returns:
             List of AgentExecution instances (may be empty)
         """
-        conn = self.db.connect()
-
-        results = conn.execute(
-            """
-            SELECT id, task_id, model_provider, model_name, status,
-                   started_at, completed_at, duration_seconds, token_count, all_messages
-            FROM agent_executions
-            WHERE task_id = ?
-            ORDER BY started_at ASC
-            """,
-            [task_id],
-        ).fetchall()
+        with self.db.acquire() as conn:
+            results = conn.execute(
+                """
+                SELECT id, task_id, model_provider, model_name, status,
+                       started_at, completed_at, duration_seconds, token_count, all_messages
+                FROM agent_executions
+                WHERE task_id = ?
+                ORDER BY started_at ASC
+                """,
+                [task_id],
+            ).fetchall()
 
         executions = []
         for row in results:
@@ -244,8 +311,56 @@ class TaskRepository:
         Raises:
             Exception: If database operation fails
         """
-        conn = self.db.connect()
+        with self.db.acquire() as conn:
+            evaluation_id = self._insert_evaluation(conn, evaluation)
+            conn.commit()
+        self.db.mark_changed()
+
+        return evaluation_id
+
+    def create_evaluations(self, evaluations: list[EvaluationResult]) -> list[int]:
+        """Create multiple evaluation records in a single transaction.
+
+        Args:
+            evaluations: EvaluationResult instances to persist
+
+        Returns:
+            Database IDs of the created evaluations, in the same order as given
+
+        Raises:
+            Exception: If database operation fails (no rows are persisted)
+        """
+        if not evaluations:
+            return []
+
+        with self.db.acquire() as conn:
+            conn.begin()
+            try:
+                evaluation_ids = [
+                    self._insert_evaluation(conn, evaluation) for evaluation in evaluations
+                ]
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+        self.db.mark_changed()
+        return evaluation_ids
+
+    @staticmethod
+    def _insert_evaluation(conn: duckdb.DuckDBPyConnection, evaluation: EvaluationResult) -> int:
+        """Insert an evaluation row without committing.
+
+        Args:
+            conn: Database connection to execute on
+            evaluation: EvaluationResult instance to persist
 
+        Returns:
+            Database ID of the inserted evaluation
+
+        Raises:
+            RuntimeError: If no ID is returned
+        """
         cursor = conn.execute(
             """
             INSERT INTO evaluations
@@ -266,25 +381,34 @@ class TaskRepository:
             raise RuntimeError("Failed to create evaluation: no ID returned")
 
         evaluation_id: int = result[0]
-        conn.commit()
-
         return evaluation_id
 
-    def get_leaderboard(self, task_id: int) -> list[dict[str, object]]:
+    def get_leaderboard(
+        self,
+        task_id: int,
+        limit: int | None = None,
+        after: dict[str, object] | None = None,
+    ) -> list[dict[str, object]]:
         """Get leaderboard entries for a specific task.
 
+        Entries are sorted by score DESC, duration ASC (missing durations last),
+        then execution ID. Pages are fetched by keyset: pass the last entry of
+        the previous page as after, so later pages cost no more than the first.
+
         Args:
             task_id: Database ID of the task
+            limit: Maximum number of entries to return (None for all)
+            after: Last entry of the previous page; only entries ranked below it
+                are returned
 
         Returns:
-            List of dictionaries with leaderboard data, sorted by score DESC, duration ASC
+            List of dictionaries with leaderboard data, in rank order
         """
-        conn = self.db.connect()
-
-        results = conn.execute(
-            """
+        # Ties on duration, including missing ones, are broken by execution ID
+        query = """
             SELECT
                 execution_id,
+                task_id,
                 model_provider,
                 model_name,
                 status,
@@ -296,25 +420,51 @@ class TaskRepository:
                 all_messages
             FROM leaderboard_entries
             WHERE task_id = ?
-            ORDER BY score DESC, duration_seconds ASC
-            """,
-            [task_id],
-        ).fetchall()
+            """
+        params: list[object] = [task_id]
+
+        if after is not None:
+            duration = after["duration_seconds"]
+            query += """
+              AND (score < ?
+                   OR (score = ? AND (COALESCE(duration_seconds, 'infinity'::DOUBLE) > ?
+                                      OR (COALESCE(duration_seconds, 'infinity'::DOUBLE) = ?
+                                          AND execution_id > ?))))
+            """
+            sort_duration = float("inf") if duration is None else duration
+            params += [
+                after["score"],
+                after["score"],
+                sort_duration,
+                sort_duration,
+                after["execution_id"],
+            ]
+
+        query += """
+            ORDER BY score DESC, COALESCE(duration_seconds, 'infinity'::DOUBLE) ASC, execution_id
+            """
+        if limit is not None:
+            query += "LIMIT ?"
+            params.append(limit)
+
+        with self.db.acquire() as conn:
+            results = conn.execute(query, params).fetchall()
 
         leaderboard = []
         for row in results:
             leaderboard.append(
                 {
                     "execution_id": row[0],
-                    "model_provider": row[1],
-                    "model_name": row[2],
-                    "status": row[3],
-                    "duration_seconds": row[4],
-                    "token_count": row[5],
-                    "score": row[6],
-                    "evaluation_text": row[7],
-                    "prompt": row[8],
-                    "all_messages": row[9],
+                    "task_id": row[1],
+                    "model_provider": row[2],
+                    "model_name": row[3],
+                    "status": row[4],
+                    "duration_seconds": row[5],
+                    "token_count": row[6],
+                    "score": row[7],
+                    "evaluation_text": row[8],
+                    "prompt": row[9],
+                    "all_messages": row[10],
                 }
             )
 
@@ -330,85 +480,89 @@ class TaskRepository:
             List of dictionaries with aggregated performance metrics per model:
             - model_provider: Provider name
             - model_name: Model name
+            - model_id: Display identifier in "provider/model" form
             - avg_duration: Average execution duration in seconds
             - std_duration: Standard deviation of duration (0 if n=1)
             - min_duration: Minimum duration
             - max_duration: Maximum duration
             - avg_tokens: Average token count
             - std_tokens: Standard deviation of token count (0 if n=1)
+            - avg_tokens_per_sec: Average tokens divided by average duration (throughput)
             - execution_count: Number of executions for this model
-        """
-        conn = self.db.connect()
 
-        if task_id is not None:
-            # Query aggregated metrics for specific task
+        Results are cached per task_id until the next write through any
+        repository sharing this database connection, so repeated chart refreshes
+        and tab switches don't re-run the aggregate query on unchanged data.
+        """
+        # Read the version before querying: a write racing the query leaves the
+        # entry stale rather than caching old rows under the new version
+        data_version = self.db.data_version
+        cached = self._metrics_cache.get(task_id)
+        if cached is not None and cached[0] == data_version:
+            # Copy the rows so callers can annotate them without touching the cache
+            return [dict(row) for row in cached[1]]
+
+        with self.db.acquire() as conn:
+            # A NULL task_id disables the filter and aggregates across all tasks
             results = conn.execute(
                 """
                 SELECT
                     model_provider,
                     model_name,
+                    model_provider || '/' || model_name as model_id,
                     AVG(duration_seconds) as avg_duration,
                     COALESCE(STDDEV_SAMP(duration_seconds), 0) as std_duration,
                     MIN(duration_seconds) as min_duration,
                     MAX(duration_seconds) as max_duration,
                     AVG(COALESCE(token_count, 0)) as avg_tokens,
                     COALESCE(STDDEV_SAMP(COALESCE(token_count, 0)), 0) as std_tokens,
+                    CASE
+                        WHEN AVG(duration_seconds) > 0
+                        THEN AVG(COALESCE(token_count, 0)) / AVG(duration_seconds)
+                        ELSE 0
+                    END as avg_tokens_per_sec,
                     COUNT(*) as execution_count
                 FROM agent_executions
-                WHERE task_id = ?
+                WHERE (CAST(? AS INTEGER) IS NULL OR task_id = ?)
                   AND status IN ('completed', 'timeout')
                   AND duration_seconds IS NOT NULL
                   AND duration_seconds > 0
                 GROUP BY model_provider, model_name
                 ORDER BY model_provider, model_name
                 """,
-                [task_id],
-            ).fetchall()
-        else:
-            # Query aggregated metrics for all tasks
-            results = conn.execute(
-                """
-                SELECT
-                    model_provider,
-                    model_name,
-                    AVG(duration_seconds) as avg_duration,
-                    COALESCE(STDDEV_SAMP(duration_seconds), 0) as std_duration,
-                    MIN(duration_seconds) as min_duration,
-                    MAX(duration_seconds) as max_duration,
-                    AVG(COALESCE(token_count, 0)) as avg_tokens,
-                    COALESCE(STDDEV_SAMP(COALESCE(token_count, 0)), 0) as std_tokens,
-                    COUNT(*) as execution_count
-                FROM agent_executions
-                WHERE status IN ('completed', 'timeout')
-                  AND duration_seconds IS NOT NULL
-                  AND duration_seconds > 0
-                GROUP BY model_provider, model_name
-                ORDER BY model_provider, model_name
-                """
+                [task_id, task_id],
             ).fetchall()
 
-        metrics = []
-        for row in results:
-            metrics.append(
-                {
-                    "model_provider": row[0],
-                    "model_name": row[1],
-                    "avg_duration": row[2],
-                    "std_duration": row[3],
-                    "min_duration": row[4],
-                    "max_duration": row[5],
-                    "avg_tokens": row[6],
-                    "std_tokens": row[7],
-                    "execution_count": row[8],
-                }
-            )
-
-        return metrics
-
-    def get_task_history(self) -> list[dict[str, object]]:
-        """Get all task submissions with execution summary.
-
-        Returns task history ordered by created_at descending (newest first).
+        columns = (
+            "model_provider",
+            "model_name",
+            "model_id",
+            "avg_duration",
+            "std_duration",
+            "min_duration",
+            "max_duration",
+            "avg_tokens",
+            "std_tokens",
+            "avg_tokens_per_sec",
+            "execution_count",
+        )
+        metrics: list[dict[str, object]] = [dict(zip(columns, row, strict=True)) for row in results]
+
+        self._metrics_cache[task_id] = (data_version, metrics)
+        return [dict(row) for row in metrics]
+
+    def get_task_history(
+        self,
+        limit: int | None = None,
+        offset: int = 0,
+        sort_by: str = "submitted_at",
+        descending: bool = True,
+        prompt_preview_length: int | None = None,
+    ) -> list[dict[str, object]]:
+        """Get task submissions with execution summary.
+
+        Returns task history ordered by submitted_at descending (newest first)
+        by default. Pass limit and offset to fetch a single page.
         Each task includes:
         - id: Task ID
         - prompt: Task prompt text
@@ -416,16 +570,46 @@ class TaskRepository:
         - execution_count: Number of executions for this task
         - highest_score: Highest evaluation score (None if no evaluations)
 
+        Args:
+            limit: Maximum number of tasks to return (None for all)
+            offset: Number of tasks to skip
+            sort_by: Column to sort by (id, submitted_at, execution_count or highest_score)
+            descending: Sort in descending order
+            prompt_preview_length: If given, prompts longer than this are truncated
+                by the database (ending in "...") so only the preview is fetched
+
         Returns:
             List of dictionaries with task history data
+
+        Raises:
+            ValueError: If sort_by is not a sortable column, or
+                prompt_preview_length is less than 4
         """
-        conn = self.db.connect()
+        sort_column = _HISTORY_SORT_COLUMNS.get(sort_by)
+        if sort_column is None:
+            raise ValueError(
+                f"Cannot sort task history by {sort_by!r}; "
+                f"expected one of {', '.join(_HISTORY_SORT_COLUMNS)}"
+            )
+        direction = "DESC" if descending else "ASC"
+
+        params: list[object] = []
+        prompt_column = "t.prompt"
+        if prompt_preview_length is not None:
+            if prompt_preview_length < 4:
+                raise ValueError(
+                    f"prompt_preview_length must be at least 4, got {prompt_preview_length}"
+                )
+            prompt_column = (
+                "CASE WHEN LENGTH(t.prompt) > ? "
+                "THEN SUBSTR(t.prompt, 1, ?) || '...' ELSE t.prompt END"
+            )
+            params = [prompt_preview_length, prompt_preview_length - 3]
 
-        results = conn.execute(
-            """
+        query = f"""
             SELECT
                 t.id,
-                t.prompt,
+                {prompt_column} as prompt,
                 t.submitted_at,
                 COUNT(e.id) as execution_count,
                 MAX(ev.score) as highest_score
@@ -433,9 +617,14 @@ class TaskRepository:
             LEFT JOIN agent_executions e ON t.id = e.task_id
             LEFT JOIN evaluations ev ON e.id = ev.execution_id
             GROUP BY t.id, t.prompt, t.submitted_at
-            ORDER BY t.submitted_at DESC
+            ORDER BY {sort_column} {direction} NULLS LAST, t.id {direction}
             """
-        ).fetchall()
+        if limit is not None:
+            query += "LIMIT ? OFFSET ?"
+            params += [limit, offset]
+
+        with self.db.acquire() as conn:
+            results = conn.execute(query, params).fetchall()
 
         history = []
         for row in results:
@@ -450,3 +639,13 @@ class TaskRepository:
             )
 
         return history
+
+    def count_tasks(self) -> int:
+        """Count all task submissions.
+
+        Returns:
+            Number of tasks in the history
+        """
+        with self.db.acquire() as conn:
+            result = conn.execute("SELECT COUNT(*) FROM task_submissions").fetchone()
+        return int(result[0]) if result is not None else 0
@@ -6,8 +6,10 @@ with timeout handling and result collection.
 
 import asyncio
 import json
+from collections.abc import Awaitable, Callable
 from typing import Any, TypedDict
 
+import pydantic_core
 from pydantic_ai import Agent
 
 from src.agents.eval_agent import format_evaluation_prompt, parse_evaluation_response
@@ -35,6 +37,42 @@ class ToolCallNode(TypedDict):
     children: list["ToolCallNode"]
 
 
+def _serialize_messages(result: Any) -> str:
+    """Serialize all messages of an agent run to a JSON string.
+
+    Uses Pydantic AI's built-in JSON serialization. Kept as a plain function so it
+    can be run in a worker thread via ``asyncio.to_thread``.
+
+    Args:
+        result: Pydantic AI run result
+
+    Returns:
+        JSON string of all messages
+
+    Raises:
+        AttributeError: If the result does not support message serialization
+    """
+    messages_json: bytes = result.all_messages_json()
+    return messages_json.decode("utf-8")
+
+
+def _extract_output_text(result: Any) -> str | None:
+    """Extract the final output text from an agent run result.
+
+    Args:
+        result: Pydantic AI run result
+
+    Returns:
+        Stripped output text, or None if the run produced no output
+    """
+    output = getattr(result, "output", None)
+    if output is None:
+        return None
+
+    text = output if isinstance(output, str) else str(output)
+    return text.strip() or None
+
+
 async def execute_single_agent(
     agent: Agent,
     prompt: str,
@@ -52,7 +90,8 @@ async def execute_single_agent(
         timeout_seconds: Maximum execution time in seconds
 
     Returns:
-        AgentExecution with results populated (status, duration, all_messages_json)
+        AgentExecution with results populated (status, duration, all_messages_json,
+        response_text)
     """
     # Create execution record
     execution = AgentExecution(
@@ -74,10 +113,13 @@ async def execute_single_agent(
             # Successful completion
             execution.mark_completed()
 
+            # Capture the final response now so evaluation doesn't re-scan the messages
+            execution.response_text = _extract_output_text(result)
+
             # Extract all messages for tool call tracking
-            # Use Pydantic AI's built-in JSON serialization
+            # Serialize in a worker thread so large transcripts don't stall sibling agents
             try:
-                execution.all_messages_json = result.all_messages_json().decode("utf-8")
+                execution.all_messages_json = await asyncio.to_thread(_serialize_messages, result)
             except (AttributeError, TypeError):
                 # Fallback if all_messages_json is not available
                 execution.all_messages_json = json.dumps([])
@@ -101,6 +143,8 @@ async def execute_multi_agent(
     prompt: str,
     task_id: int,
     timeout_seconds: float,
+    semaphore: asyncio.Semaphore | None = None,
+    on_agent_done: Callable[[AgentExecution], Awaitable[None]] | None = None,
 ) -> list[AgentExecution]:
     """Execute multiple agents in parallel.
 
@@ -110,6 +154,10 @@ async def execute_multi_agent(
         prompt: Task prompt to execute
         task_id: Database ID of the task
         timeout_seconds: Maximum execution time in seconds per agent
+        semaphore: Optional semaphore limiting how many agents run at once.
+            The timeout of an agent starts once it acquires the semaphore.
+        on_agent_done: Optional callback awaited with each execution as soon as
+            that agent finishes, before the remaining agents are done
 
     Returns:
         List of AgentExecution results (one per agent)
@@ -122,11 +170,20 @@ async def execute_multi_agent(
             f"Agents count ({len(agents)}) must match model configs count ({len(model_configs)})"
         )
 
+    async def run_agent(agent: Agent, config: ModelConfig) -> AgentExecution:
+        if semaphore is None:
+            execution = await execute_single_agent(agent, prompt, config, task_id, timeout_seconds)
+        else:
+            async with semaphore:
+                execution = await execute_single_agent(
+                    agent, prompt, config, task_id, timeout_seconds
+                )
+        if on_agent_done is not None:
+            await on_agent_done(execution)
+        return execution
+
     # Create tasks for parallel execution
-    tasks = [
-        execute_single_agent(agent, prompt, config, task_id, timeout_seconds)
-        for agent, config in zip(agents, model_configs, strict=True)
-    ]
+    tasks = [run_agent(agent, config) for agent, config in zip(agents, model_configs, strict=True)]
 
     # Execute all agents in parallel
     results = await asyncio.gather(*tasks)
@@ -150,8 +207,8 @@ def extract_agent_response(execution: AgentExecution) -> str:
         raise ValueError("Execution has no messages (possibly timed out)")
 
     try:
-        messages = json.loads(execution.all_messages_json)
-    except json.JSONDecodeError as e:
+        messages = execution.messages
+    except ValueError as e:
         raise ValueError(f"Failed to parse messages JSON: {e}") from e
 
     if isinstance(messages, dict) and "error" in messages:
@@ -206,12 +263,14 @@ async def evaluate_execution(
     if execution.id is None:
         raise ValueError("Cannot evaluate execution without database ID")
 
-    # Extract agent's response from messages
-    try:
-        agent_response = extract_agent_response(execution)
-    except ValueError as e:
-        # If we can't extract response, create a low-score evaluation
-        agent_response = f"Failed to extract response: {e}"
+    # Prefer the response captured at execution time, fall back to the messages
+    agent_response = execution.response_text
+    if not agent_response:
+        try:
+            agent_response = extract_agent_response(execution)
+        except ValueError as e:
+            # If we can't extract response, create a low-score evaluation
+            agent_response = f"Failed to extract response: {e}"
 
     # Format evaluation prompt
     formatted_prompt = format_evaluation_prompt(eval_config.prompt, task_prompt, agent_response)
@@ -260,14 +319,46 @@ def extract_tool_hierarchy(execution: AgentExecution) -> list[ToolCallNode]:
     Raises:
         ValueError: If messages cannot be parsed
     """
-    if execution.all_messages_json is None:
+    try:
+        messages = execution.messages
+    except ValueError as e:
+        raise ValueError(f"Failed to parse messages JSON: {e}") from e
+
+    return _build_tool_hierarchy(messages)
+
+
+def parse_tool_hierarchy(messages_json: str | None) -> list[ToolCallNode]:
+    """Extract tool call hierarchy from a messages JSON string.
+
+    Args:
+        messages_json: Pydantic AI all_messages output as JSON string
+
+    Returns:
+        List of root-level tool call nodes (tools called directly by agent)
+
+    Raises:
+        ValueError: If messages cannot be parsed
+    """
+    if messages_json is None:
         return []
 
     try:
-        messages = json.loads(execution.all_messages_json)
-    except json.JSONDecodeError as e:
+        messages = pydantic_core.from_json(messages_json)
+    except ValueError as e:
         raise ValueError(f"Failed to parse messages JSON: {e}") from e
 
+    return _build_tool_hierarchy(messages)
+
+
+def _build_tool_hierarchy(messages: Any) -> list[ToolCallNode]:
+    """Build the tool call hierarchy from decoded messages.
+
+    Args:
+        messages: Decoded all_messages_json (None if there are no messages)
+
+    Returns:
+        List of root-level tool call nodes (tools called directly by agent)
+    """
     if not isinstance(messages, list):
         # Handle error dict format
         return []
@@ -344,21 +435,26 @@ def extract_tool_hierarchy(execution: AgentExecution) -> list[ToolCallNode]:
 def calculate_tree_depth(nodes: list[ToolCallNode]) -> int:
     """Calculate the maximum depth of tool call tree.
 
+    Uses an explicit stack instead of recursion so very deep traces neither hit
+    the recursion limit nor pay per-call frame overhead.
+
     Args:
         nodes: List of root-level tool call nodes
 
     Returns:
         Maximum depth (0 for empty tree, 1 for single level)
     """
-    if not nodes:
-        return 0
+    max_depth = 0
+    stack: list[tuple[ToolCallNode, int]] = [(node, 1) for node in nodes]
 
-    def get_depth(node: ToolCallNode) -> int:
-        if not node["children"]:
-            return 1
-        return 1 + max(get_depth(child) for child in node["children"])
+    while stack:
+        node, depth = stack.pop()
+        if depth > max_depth:
+            max_depth = depth
+        for child in node["children"]:
+            stack.append((child, depth + 1))
 
-    return max(get_depth(node) for node in nodes)
+    return max_depth
 
 
 def count_leaf_nodes(nodes: list[ToolCallNode]) -> int:
@@ -370,15 +466,17 @@ def count_leaf_nodes(nodes: list[ToolCallNode]) -> int:
     Returns:
         Number of leaf nodes
     """
-    if not nodes:
-        return 0
+    leaf_count = 0
+    stack: list[ToolCallNode] = list(nodes)
 
-    def count_leaves(node: ToolCallNode) -> int:
-        if not node["children"]:
-            return 1
-        return sum(count_leaves(child) for child in node["children"])
+    while stack:
+        children = stack.pop()["children"]
+        if children:
+            stack.extend(children)
+        else:
+            leaf_count += 1
 
-    return sum(count_leaves(node) for node in nodes)
+    return leaf_count
 
 
 def format_tool_call(node: ToolCallNode, max_result_length: int = 100) -> str:
@@ -458,8 +556,8 @@ def extract_execution_log(execution: AgentExecution) -> list[ExecutionLogEntry]:
         return []
 
     try:
-        messages = json.loads(execution.all_messages_json)
-    except json.JSONDecodeError as e:
+        messages = execution.messages
+    except ValueError as e:
         raise ValueError(f"Failed to parse messages JSON: {e}") from e
 
     if not isinstance(messages, list):
@@ -7,8 +7,15 @@ from dataclasses import dataclass, field
 
 from src.models.execution import ExecutionStatus
 
+# Statuses after which an agent no longer changes state
+_TERMINAL_STATUSES = frozenset(
+    {ExecutionStatus.COMPLETED, ExecutionStatus.FAILED, ExecutionStatus.TIMEOUT}
+)
+# Terminal statuses that count as unsuccessful
+_FAILED_STATUSES = frozenset({ExecutionStatus.FAILED, ExecutionStatus.TIMEOUT})
 
-@dataclass
+
+@dataclass(slots=True)
 class AgentExecutionState:
     """Tracks the execution state of a single agent.
 
@@ -34,7 +41,7 @@ class AgentExecutionState:
         return f"{self.model_provider}/{self.model_name}"
 
 
-@dataclass
+@dataclass(slots=True)
 class MultiAgentExecutionState:
     """Tracks the execution state of multiple agents running in parallel.
 
@@ -46,6 +53,17 @@ class MultiAgentExecutionState:
     task_id: int
     agent_states: dict[str, AgentExecutionState] = field(default_factory=dict)
 
+    def reset(self, task_id: int) -> None:
+        """Start tracking a new task, forgetting all agents.
+
+        Lets a page reuse one tracker across submissions.
+
+        Args:
+            task_id: Database ID of the new task
+        """
+        self.task_id = task_id
+        self.agent_states.clear()
+
     def add_agent(
         self, model_provider: str, model_name: str, execution_id: int | None = None
     ) -> None:
@@ -101,13 +119,7 @@ class MultiAgentExecutionState:
         Returns:
             True if all agents are in a terminal state, False otherwise
         """
-        terminal_statuses = {
-            ExecutionStatus.COMPLETED,
-            ExecutionStatus.FAILED,
-            ExecutionStatus.TIMEOUT,
-        }
-
-        return all(state.status in terminal_statuses for state in self.agent_states.values())
+        return all(state.status in _TERMINAL_STATUSES for state in self.agent_states.values())
 
     def get_completed_count(self) -> int:
         """Get the number of agents that have completed successfully.
@@ -115,9 +127,11 @@ class MultiAgentExecutionState:
         Returns:
             Count of agents with COMPLETED status
         """
-        return sum(
-            1 for state in self.agent_states.values() if state.status == ExecutionStatus.COMPLETED
-        )
+        count = 0
+        for state in self.agent_states.values():
+            if state.status == ExecutionStatus.COMPLETED:
+                count += 1
+        return count
 
     def get_failed_count(self) -> int:
         """Get the number of agents that have failed or timed out.
@@ -125,8 +139,8 @@ class MultiAgentExecutionState:
         Returns:
             Count of agents with FAILED or TIMEOUT status
         """
-        return sum(
-            1
-            for state in self.agent_states.values()
-            if state.status in {ExecutionStatus.FAILED, ExecutionStatus.TIMEOUT}
-        )
+        count = 0
+        for state in self.agent_states.values():
+            if state.status in _FAILED_STATUSES:
+                count += 1
+        return count
@@ -3,9 +3,11 @@
 This module defines the domain model for agent execution evaluations.
 """
 
+from collections.abc import Iterable, Mapping
 from datetime import datetime
+from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 class EvaluationResult(BaseModel):
@@ -15,7 +17,7 @@ class EvaluationResult(BaseModel):
         id: Primary key (None for new evaluations)
         execution_id: Foreign key to AgentExecution
         score: Numeric score from 0 to 100 (inclusive)
-        explanation: Text explanation of the score
+        explanation: Text explanation of the score (stored trimmed)
         evaluated_at: Evaluation timestamp
     """
 
@@ -25,26 +27,54 @@ class EvaluationResult(BaseModel):
     explanation: str = Field(min_length=1)
     evaluated_at: datetime = Field(default_factory=datetime.now)
 
-    @property
-    def explanation_trimmed(self) -> str:
-        """Get trimmed explanation text.
+    @classmethod
+    def bulk_create(cls, rows: Iterable[Mapping[str, Any]]) -> list["EvaluationResult"]:
+        """Create several evaluations that share one evaluation timestamp.
+
+        The timestamp is captured once for the whole batch instead of once per
+        instance; rows that carry their own evaluated_at keep it. Every row is
+        still fully validated.
+
+        Args:
+            rows: Field values for each evaluation
 
         Returns:
-            Explanation with leading/trailing whitespace removed
+            List of validated EvaluationResult instances, in input order
+
+        Raises:
+            ValueError: If any row is invalid
         """
-        return self.explanation.strip()
+        evaluated_at = datetime.now()
+        return [cls.model_validate({"evaluated_at": evaluated_at, **row}) for row in rows]
 
-    def model_post_init(self, __context: object) -> None:
-        """Post-initialization validation.
+    @field_validator("explanation")
+    @classmethod
+    def strip_explanation(cls, v: str) -> str:
+        """Strip surrounding whitespace from the explanation.
 
         Args:
-            __context: Pydantic context (unused)
+            v: Explanation text
+
+        Returns:
+            Explanation with leading/trailing whitespace removed
 
         Raises:
             ValueError: If explanation is empty after trimming
         """
-        if not self.explanation_trimmed:
+        stripped = v.strip()
+        if not stripped:
             raise ValueError("Explanation must not be empty after trimming whitespace")
+        return stripped
+
+    @property
+    def explanation_trimmed(self) -> str:
+        """Get trimmed explanation text.
+
+        Returns:
+            Explanation with leading/trailing whitespace removed (already
+            trimmed on validation)
+        """
+        return self.explanation
 
     @property
     def is_passing(self) -> bool:
@@ -5,8 +5,10 @@ This module defines the domain model for agent execution attempts.
 
 from datetime import datetime
 from enum import Enum
+from typing import Any
 
-from pydantic import BaseModel, Field
+import pydantic_core
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class ExecutionStatus(str, Enum):
@@ -39,6 +41,8 @@ class AgentExecution(BaseModel):
         duration_seconds: Execution duration (None if not completed)
         token_count: Total tokens consumed (None if not available)
         all_messages_json: Pydantic AI's all_messages output as JSON string
+        response_text: Final agent output captured at execution time (not persisted;
+            None for executions loaded from the database)
     """
 
     id: int | None = None
@@ -51,6 +55,51 @@ class AgentExecution(BaseModel):
     duration_seconds: float | None = None
     token_count: int | None = Field(default=None, ge=0)
     all_messages_json: str | None = None
+    response_text: str | None = None
+
+    # (all_messages_json, parsed value) of the last parse, see messages
+    _messages_cache: tuple[str, Any] | None = PrivateAttr(default=None)
+
+    @property
+    def messages(self) -> Any:
+        """Get all_messages_json decoded from JSON.
+
+        The JSON is parsed on first access and the result reused until
+        all_messages_json is replaced, so the evaluator, execution log and tool
+        tree don't each parse the same transcript. Callers must not modify the
+        returned value.
+
+        Returns:
+            Decoded messages (a list of message dicts, or an error dict for failed
+            executions), or None if there are no messages
+
+        Raises:
+            ValueError: If all_messages_json is not valid JSON
+        """
+        if self.all_messages_json is None:
+            return None
+
+        cached = self._messages_cache
+        if cached is None or cached[0] is not self.all_messages_json:
+            # pydantic_core's Rust parser decodes large transcripts much faster than json
+            cached = (self.all_messages_json, pydantic_core.from_json(self.all_messages_json))
+            self._messages_cache = cached
+        return cached[1]
+
+    def __eq__(self, other: object) -> bool:
+        """Compare field values only, so the messages cache never affects equality."""
+        if not isinstance(other, AgentExecution):
+            return NotImplemented
+        return type(self) is type(other) and self.__dict__ == other.__dict__
+
+    @property
+    def model_identifier(self) -> str:
+        """Get full model identifier.
+
+        Returns:
+            Combined provider and model name (e.g., "openai/gpt-4o")
+        """
+        return f"{self.model_provider}/{self.model_name}"
 
     def calculate_duration(self) -> None:
         """Calculate and set duration_seconds from timestamps.
@@ -5,7 +5,7 @@ This module defines the domain model for user task submissions.
 
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 class TaskSubmission(BaseModel):
@@ -13,7 +13,7 @@ class TaskSubmission(BaseModel):
 
     Attributes:
         id: Primary key (None for new submissions)
-        prompt: Natural language task description
+        prompt: Natural language task description (stored trimmed)
         submitted_at: Submission timestamp
     """
 
@@ -21,23 +21,31 @@ class TaskSubmission(BaseModel):
     prompt: str = Field(min_length=1)
     submitted_at: datetime = Field(default_factory=datetime.now)
 
-    @property
-    def prompt_trimmed(self) -> str:
-        """Get trimmed prompt text.
+    @field_validator("prompt")
+    @classmethod
+    def strip_prompt(cls, v: str) -> str:
+        """Strip surrounding whitespace from the prompt.
+
+        Args:
+            v: Prompt text
 
         Returns:
             Prompt with leading/trailing whitespace removed
-        """
-        return self.prompt.strip()
-
-    def model_post_init(self, __context: object) -> None:
-        """Post-initialization validation.
-
-        Args:
-            __context: Pydantic context (unused)
 
         Raises:
             ValueError: If prompt is empty after trimming
         """
-        if not self.prompt_trimmed:
+        stripped = v.strip()
+        if not stripped:
             raise ValueError("Prompt must not be empty after trimming whitespace")
+        return stripped
+
+    @property
+    def prompt_trimmed(self) -> str:
+        """Get trimmed prompt text.
+
+        Returns:
+            Prompt with leading/trailing whitespace removed (already trimmed on
+            validation)
+        """
+        return self.prompt
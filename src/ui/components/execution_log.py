@@ -4,6 +4,8 @@ This module provides a UI component for displaying chronological execution logs.
 Shows user messages, tool calls, tool responses, and assistant messages in order.
 """
 
+import functools
+import json
 from typing import Any
 
 from nicegui import ui
@@ -11,6 +13,36 @@ from nicegui import ui
 from src.execution.executor import ExecutionLogEntry, extract_execution_log
 from src.models.execution import AgentExecution
 
+# (substring of the lowercased message type, icon, color), checked in order
+_MESSAGE_STYLES: tuple[tuple[str, str, str], ...] = (
+    ("user", "person", "blue"),
+    ("assistant", "smart_toy", "green"),
+    ("model", "smart_toy", "green"),
+    ("tool_call", "play_arrow", "purple"),
+    ("tool_response", "check_circle", "orange"),
+    ("tool-response", "check_circle", "orange"),
+)
+
+# Style of message types not matching any entry of _MESSAGE_STYLES
+_DEFAULT_MESSAGE_STYLE = ("info", "grey")
+
+
+@functools.lru_cache(maxsize=64)
+def _message_style(message_type: str) -> tuple[str, str]:
+    """Look up the icon and color of a message type.
+
+    Args:
+        message_type: Message type (user, assistant, tool_call, tool_response, etc.)
+
+    Returns:
+        Tuple of (Material icon name, Tailwind CSS color)
+    """
+    type_lower = message_type.lower()
+    for needle, icon, color in _MESSAGE_STYLES:
+        if needle in type_lower:
+            return icon, color
+    return _DEFAULT_MESSAGE_STYLE
+
 
 def get_message_icon(message_type: str) -> str:
     """Get icon for message type.
@@ -21,18 +53,7 @@ def get_message_icon(message_type: str) -> str:
     Returns:
         Material icon name
     """
-    type_lower = message_type.lower()
-
-    if "user" in type_lower:
-        return "person"
-    elif "assistant" in type_lower or "model" in type_lower:
-        return "smart_toy"
-    elif "tool_call" in type_lower:
-        return "play_arrow"
-    elif "tool_response" in type_lower or "tool-response" in type_lower:
-        return "check_circle"
-    else:
-        return "info"
+    return _message_style(message_type)[0]
 
 
 def get_message_color(message_type: str) -> str:
@@ -44,23 +65,20 @@ def get_message_color(message_type: str) -> str:
     Returns:
         Tailwind CSS color class
     """
-    type_lower = message_type.lower()
+    return _message_style(message_type)[1]
 
-    if "user" in type_lower:
-        return "blue"
-    elif "assistant" in type_lower or "model" in type_lower:
-        return "green"
-    elif "tool_call" in type_lower:
-        return "purple"
-    elif "tool_response" in type_lower or "tool-response" in type_lower:
-        return "orange"
-    else:
-        return "grey"
+
+# Pretty-printing encoder for dict content (values that aren't JSON types use str())
+_CONTENT_ENCODER = json.JSONEncoder(indent=2, default=str)
 
 
 def format_content(content: Any, max_length: int = 300) -> str:
     """Format message content for display.
 
+    Dicts are pretty-printed incrementally and encoding stops as soon as
+    max_length is exceeded, so large tool responses aren't serialized in full
+    only to be truncated.
+
     Args:
         content: Message content (can be string, dict, or other)
         max_length: Maximum length before truncation
@@ -69,10 +87,14 @@ def format_content(content: Any, max_length: int = 300) -> str:
         Formatted content string
     """
     if isinstance(content, dict):
-        # Pretty print dict
-        import json
-
-        content_str = json.dumps(content, indent=2)
+        chunks: list[str] = []
+        length = 0
+        for chunk in _CONTENT_ENCODER.iterencode(content):
+            chunks.append(chunk)
+            length += len(chunk)
+            if length > max_length:
+                break
+        content_str = "".join(chunks)
     else:
         content_str = str(content)
 
@@ -83,6 +105,44 @@ def format_content(content: Any, max_length: int = 300) -> str:
     return content_str
 
 
+# Height limit of the execution log table; longer logs scroll virtually
+LOG_TABLE_MAX_HEIGHT = "600px"
+
+# Columns of the execution log table (icon and content are rendered by LOG_ROW_SLOT)
+LOG_COLUMNS: list[dict[str, Any]] = [
+    {"name": "expand", "label": "", "field": "index"},
+    {"name": "type", "label": "Type", "field": "type", "align": "left"},
+    {"name": "timestamp", "label": "Timestamp", "field": "timestamp", "align": "right"},
+]
+
+# Table row: colored type with icon, plus a toggle revealing the content below it
+LOG_ROW_SLOT = r"""
+<q-tr :props="props" :class="'border-l-4 border-' + props.row.color + '-500'">
+    <q-td auto-width>
+        <q-btn flat dense round size="sm"
+               :icon="props.expand ? 'expand_less' : 'description'"
+               @click="props.expand = !props.expand">
+            <q-tooltip>Content</q-tooltip>
+        </q-btn>
+    </q-td>
+    <q-td key="type" :props="props">
+        <q-icon :name="props.row.icon" :class="'text-' + props.row.color + '-600'" size="sm" />
+        <span :class="'q-ml-sm font-bold text-' + props.row.color + '-700'">
+            {{ props.row.type }}
+        </span>
+    </q-td>
+    <q-td key="timestamp" :props="props" class="text-caption text-grey-6">
+        {{ props.row.timestamp }}
+    </q-td>
+</q-tr>
+<q-tr v-show="props.expand" :props="props">
+    <q-td colspan="100%">
+        <div class="whitespace-pre-wrap font-mono text-sm">{{ props.row.content }}</div>
+    </q-td>
+</q-tr>
+"""
+
+
 class ExecutionLog:
     """Execution log display component.
 
@@ -97,6 +157,7 @@ class ExecutionLog:
         """
         self.execution = execution
         self.container: ui.column | None = None
+        self.table: ui.table | None = None
 
     def create(self) -> None:
         """Create the execution log UI component."""
@@ -128,44 +189,43 @@ class ExecutionLog:
             )
             return
 
-        # Render each log entry
-        for entry in log_entries:
-            self._render_log_entry(entry)
+        # Render all entries as rows of a single table. Virtual scrolling keeps
+        # only the visible rows in the DOM, so long transcripts render quickly.
+        self.table = (
+            ui.table(
+                columns=LOG_COLUMNS,
+                rows=[self._build_row(entry) for entry in log_entries],
+                row_key="index",
+                pagination={"rowsPerPage": 0},
+            )
+            .props("virtual-scroll hide-bottom")
+            .classes("w-full")
+            .style(f"max-height: {LOG_TABLE_MAX_HEIGHT}")
+        )
+        self.table.add_slot("body", LOG_ROW_SLOT)
 
-    def _render_log_entry(self, entry: ExecutionLogEntry) -> None:
-        """Render a single log entry.
+    @staticmethod
+    def _build_row(entry: ExecutionLogEntry) -> dict[str, Any]:
+        """Build the table row of a log entry.
 
         Args:
-            entry: Execution log entry to render
+            entry: Execution log entry to display
+
+        Returns:
+            Row dictionary for the log table
         """
         msg_type = entry["type"]
-        content = entry["content"]
         tool_name = entry["tool_name"]
-        timestamp = entry["timestamp"]
-
-        # Get styling
-        icon = get_message_icon(msg_type)
-        color = get_message_color(msg_type)
-
-        # Create entry card
-        with ui.card().classes(f"w-full border-l-4 border-{color}-500"):
-            with ui.row().classes("w-full items-center gap-2"):
-                ui.icon(icon).classes(f"text-{color}-600")
-
-                # Type label
-                type_label = msg_type
-                if tool_name:
-                    type_label = f"{msg_type}: {tool_name}"
-                ui.label(type_label).classes(f"font-bold text-{color}-700")
-
-                # Timestamp (if available)
-                if timestamp:
-                    ui.label(timestamp).classes("text-caption text-grey-6 ml-auto")
+        icon, color = _message_style(msg_type)
 
-            # Content
-            content_str = format_content(content)
-            with ui.expansion("Content", icon="description").classes("w-full"):
-                ui.label(content_str).classes("whitespace-pre-wrap font-mono text-sm")
+        return {
+            "index": entry["index"],
+            "icon": icon,
+            "color": color,
+            "type": f"{msg_type}: {tool_name}" if tool_name else msg_type,
+            "timestamp": entry["timestamp"] or "",
+            "content": format_content(entry["content"]),
+        }
 
     def update_execution(self, execution: AgentExecution) -> None:
         """Update the log for a different execution.
@@ -175,6 +235,7 @@ class ExecutionLog:
         """
         self.execution = execution
         if self.container:
+            self.table = None
             self.container.clear()
             with self.container:
                 self._render_log()
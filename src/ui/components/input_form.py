@@ -3,6 +3,7 @@
 This module provides a UI component for task prompt input.
 """
 
+import inspect
 import logging
 from collections.abc import Awaitable, Callable
 
@@ -44,25 +45,25 @@ def create_task_input_form(on_submit: Callable[[str], None | Awaitable[None]]) -
         # Submit button
         async def handle_click() -> None:
             """Handle submit button click."""
-            logger.info("Submit button clicked")
+            logger.debug("Submit button clicked")
             prompt = prompt_input.value.strip() if prompt_input.value else ""
-            logger.info(f"Prompt value: {prompt[:50] if prompt else '(empty)'}...")
+            logger.debug("Prompt value: %.50s...", prompt or "(empty)")
 
             if prompt:
-                logger.info("Calling on_submit callback")
+                logger.debug("Calling on_submit callback")
                 try:
                     result = on_submit(prompt)
                     # Handle both sync and async callbacks
-                    if isinstance(result, Awaitable):
-                        logger.info("Awaiting async callback")
+                    if inspect.isawaitable(result):
+                        logger.debug("Awaiting async callback")
                         await result
-                    logger.info("Callback completed, clearing input")
+                    logger.debug("Callback completed, clearing input")
                     prompt_input.value = ""  # Clear input after submission
                 except Exception as e:
-                    logger.error(f"Error in submit callback: {e}", exc_info=True)
+                    logger.error("Error in submit callback: %s", e, exc_info=True)
                     ui.notify(f"Error: {str(e)}", type="negative")
             else:
-                logger.warning("Empty prompt, showing warning")
+                logger.debug("Empty prompt, showing warning")
                 ui.notify("Please enter a task prompt", type="warning")
 
         ui.button("Execute Task", on_click=handle_click).props("color=primary")
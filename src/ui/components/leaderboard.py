@@ -4,14 +4,151 @@ This module provides a UI component for displaying agent execution leaderboard.
 Shows evaluation scores, rankings, and performance metrics.
 """
 
-from typing import Any, cast
+import re
+from typing import Any
 
 from nicegui import ui
 
 from src.database.repositories import TaskRepository
+from src.models.execution import AgentExecution
+from src.ui.components.agent_responses import get_agent_response
 from src.ui.components.execution_log import create_execution_log
 
 
+def _compact_template(template: str) -> str:
+    """Collapse whitespace of a slot template (done once, at import).
+
+    Args:
+        template: Vue template source
+
+    Returns:
+        Template on a single line
+    """
+    return re.sub(r"\s+", " ", template).strip()
+
+
+# Leaderboard table columns (rank, model, score and actions are rendered by slots)
+LEADERBOARD_COLUMNS: list[dict[str, Any]] = [
+    {
+        "name": "rank",
+        "label": "Rank",
+        "field": "rank",
+        "align": "center",
+        "sortable": False,
+    },
+    {
+        "name": "model",
+        "label": "Model",
+        "field": "model_name",
+        "align": "left",
+        "sortable": True,
+    },
+    {
+        "name": "score",
+        "label": "Score",
+        "field": "score",
+        "align": "center",
+        "sortable": True,
+    },
+    {
+        "name": "duration",
+        "label": "Duration",
+        "field": "duration",
+        "align": "center",
+        "sortable": True,
+    },
+    {
+        "name": "tokens",
+        "label": "Tokens",
+        "field": "tokens",
+        "align": "center",
+        "sortable": True,
+    },
+    {
+        "name": "explanation",
+        "label": "Explanation",
+        "field": "explanation",
+        "align": "left",
+        "sortable": False,
+    },
+    {
+        "name": "actions",
+        "label": "Actions",
+        "field": "actions",
+        "align": "center",
+        "sortable": False,
+    },
+]
+
+# Score cell: grade icon and badge colored by score
+SCORE_CELL_SLOT = _compact_template(
+    r"""
+<q-td :props="props">
+    <q-icon v-if="typeof props.row.score === 'number'" size="xs" class="q-mr-xs"
+            :name="props.row.score >= 90 ? 'emoji_events' :
+                   props.row.score >= 80 ? 'thumb_up' :
+                   props.row.score >= 70 ? 'check' :
+                   props.row.score >= 60 ? 'remove' : 'thumb_down'" />
+    <q-badge :color="props.row.score >= 90 ? 'green' :
+                     props.row.score >= 80 ? 'light-green' :
+                     props.row.score >= 70 ? 'yellow' :
+                     props.row.score >= 60 ? 'orange' : 'red'">
+        {{ props.row.score }}
+    </q-badge>
+</q-td>
+"""
+)
+
+# Model cell: "provider/model", joined in the browser
+MODEL_CELL_SLOT = _compact_template(
+    r"""
+<q-td :props="props">{{ props.row.provider }}/{{ props.row.model_name }}</q-td>
+"""
+)
+
+# Rank cell: trophies for the top three
+RANK_CELL_SLOT = _compact_template(
+    r"""
+<q-td :props="props">
+    <div class="text-center">
+        <q-icon v-if="props.row.rank === 1"
+                name="emoji_events" color="gold" size="sm" />
+        <q-icon v-else-if="props.row.rank === 2"
+                name="emoji_events" color="silver" size="sm" />
+        <q-icon v-else-if="props.row.rank === 3"
+                name="emoji_events" color="brown" size="sm" />
+        <span v-else>{{ props.row.rank }}</span>
+    </div>
+</q-td>
+"""
+)
+
+# Actions cell: button opening the execution log (emits view_log)
+ACTIONS_CELL_SLOT = _compact_template(
+    r"""
+<q-td :props="props">
+    <q-btn
+        flat dense round
+        icon="visibility"
+        color="primary"
+        @click="$parent.$emit('view_log', props.row.execution_id)"
+    >
+        <q-tooltip>View Execution Log</q-tooltip>
+    </q-btn>
+</q-td>
+"""
+)
+
+# Height limit of the leaderboard table; longer leaderboards scroll virtually
+LEADERBOARD_MAX_HEIGHT = "600px"
+
+# Leaderboard entries fetched per page; more are loaded when scrolling to the end
+LEADERBOARD_PAGE_SIZE = 50
+
+# Explanation characters sent per table row; the full text is shown in the log dialog
+EXPLANATION_PREVIEW_LENGTH = 120
+
+
 def format_duration(seconds: float | None) -> str:
     """Format duration in seconds to human-readable string.
 
@@ -26,6 +163,22 @@ def format_duration(seconds: float | None) -> str:
     return f"{seconds:.2f}s"
 
 
+def _explanation_preview(text: str | None) -> str:
+    """Shorten an evaluation explanation for the table row.
+
+    Args:
+        text: Full explanation text
+
+    Returns:
+        Explanation cut to EXPLANATION_PREVIEW_LENGTH characters, or "N/A"
+    """
+    if text is None:
+        return "N/A"
+    if len(text) <= EXPLANATION_PREVIEW_LENGTH:
+        return text
+    return text[: EXPLANATION_PREVIEW_LENGTH - 3] + "..."
+
+
 def get_score_color(score: int) -> str:
     """Get color for score display based on value.
 
@@ -85,6 +238,13 @@ class LeaderboardTable:
         self.task_id = task_id
         self.container: ui.card | None = None
         self.table: ui.table | None = None
+        # (task_id, data_version) of the rendered leaderboard; see refresh()
+        self._rendered_version: tuple[int, int] | None = None
+        # Leaderboard entries by execution ID, used by the execution log dialog
+        self._entries_by_exec_id: dict[int, dict[str, Any]] = {}
+        # Last fetched entry (the keyset for the next page) and whether more exist
+        self._last_entry: dict[str, Any] | None = None
+        self._has_more = False
 
     def create(self) -> None:
         """Create the leaderboard table UI component."""
@@ -97,147 +257,41 @@ class LeaderboardTable:
             else:
                 ui.label("No task selected").classes("text-grey-6")
 
-    def _render_leaderboard(self) -> None:
-        """Render leaderboard table for the current task."""
+    def _render_leaderboard(self, rows: list[dict[str, Any]] | None = None) -> None:
+        """Render leaderboard table for the current task.
+
+        Args:
+            rows: Table rows already fetched by the caller, queried if omitted
+        """
         if not self.task_id:
             return
 
-        # Query leaderboard data
-        leaderboard_entries = self.repository.get_leaderboard(self.task_id)
+        if rows is None:
+            rows = self._fetch_rows()
 
-        if not leaderboard_entries:
+        if not rows:
+            self.table = None
             ui.label("No evaluations available yet").classes("text-grey-6")
             return
 
-        # Define table columns
-        columns = [
-            {
-                "name": "rank",
-                "label": "Rank",
-                "field": "rank",
-                "align": "center",
-                "sortable": False,
-            },
-            {
-                "name": "model",
-                "label": "Model",
-                "field": "model",
-                "align": "left",
-                "sortable": True,
-            },
-            {
-                "name": "score",
-                "label": "Score",
-                "field": "score",
-                "align": "center",
-                "sortable": True,
-            },
-            {
-                "name": "duration",
-                "label": "Duration",
-                "field": "duration",
-                "align": "center",
-                "sortable": True,
-            },
-            {
-                "name": "tokens",
-                "label": "Tokens",
-                "field": "tokens",
-                "align": "center",
-                "sortable": True,
-            },
-            {
-                "name": "explanation",
-                "label": "Explanation",
-                "field": "explanation",
-                "align": "left",
-                "sortable": False,
-            },
-            {
-                "name": "actions",
-                "label": "Actions",
-                "field": "actions",
-                "align": "center",
-                "sortable": False,
-            },
-        ]
-
-        # Prepare table rows
-        rows = []
-        for rank, entry in enumerate(leaderboard_entries, start=1):
-            model_identifier = f"{entry['model_provider']}/{entry['model_name']}"
-            duration_val = entry.get("duration_seconds")
-            duration_seconds = cast(float, duration_val) if duration_val is not None else None
-            execution_id = cast(int, entry["execution_id"])
-            rows.append(
-                {
-                    "rank": rank,
-                    "model": model_identifier,
-                    "score": entry.get("score") or "N/A",
-                    "duration": format_duration(duration_seconds),
-                    "tokens": entry.get("token_count") or "N/A",
-                    "explanation": entry.get("evaluation_text", "N/A"),
-                    "execution_id": execution_id,
-                    "actions": "",  # Placeholder for actions column
-                }
+        # Create table. Virtual scrolling keeps only the visible rows in the DOM,
+        # so large model pools don't slow down the first paint.
+        self.table = (
+            ui.table(
+                columns=LEADERBOARD_COLUMNS,
+                rows=rows,
+                row_key="execution_id",
+                pagination={"rowsPerPage": 0},
             )
-
-        # Create table
-        self.table = ui.table(
-            columns=columns,
-            rows=rows,
-            row_key="rank",
-        ).classes("w-full")
-
-        # Add custom styling for score column
-        self.table.add_slot(
-            "body-cell-score",
-            r"""
-            <q-td :props="props">
-                <q-badge :color="props.row.score >= 90 ? 'green' :
-                                 props.row.score >= 80 ? 'light-green' :
-                                 props.row.score >= 70 ? 'yellow' :
-                                 props.row.score >= 60 ? 'orange' : 'red'">
-                    {{ props.row.score }}
-                </q-badge>
-            </q-td>
-            """,
-        )
-
-        # Add custom styling for rank column
-        self.table.add_slot(
-            "body-cell-rank",
-            r"""
-            <q-td :props="props">
-                <div class="text-center">
-                    <q-icon v-if="props.row.rank === 1"
-                            name="emoji_events" color="gold" size="sm" />
-                    <q-icon v-else-if="props.row.rank === 2"
-                            name="emoji_events" color="silver" size="sm" />
-                    <q-icon v-else-if="props.row.rank === 3"
-                            name="emoji_events" color="brown" size="sm" />
-                    <span v-else>{{ props.row.rank }}</span>
-                </div>
-            </q-td>
-            """,
+            .props("virtual-scroll hide-bottom")
+            .classes("w-full")
+            .style(f"max-height: {LEADERBOARD_MAX_HEIGHT}")
         )
 
-        # Add actions column with view log button
-        self.table.add_slot(
-            "body-cell-actions",
-            r"""
-            <q-td :props="props">
-                <q-btn
-                    flat dense round
-                    icon="visibility"
-                    color="primary"
-                    @click="$parent.$emit('view_log', props.row.execution_id)"
-                >
-                    <q-tooltip>View Execution Log</q-tooltip>
-                </q-btn>
-            </q-td>
-            """,
-        )
+        self.table.add_slot("body-cell-score", SCORE_CELL_SLOT)
+        self.table.add_slot("body-cell-rank", RANK_CELL_SLOT)
+        self.table.add_slot("body-cell-model", MODEL_CELL_SLOT)
+        self.table.add_slot("body-cell-actions", ACTIONS_CELL_SLOT)
 
         # Handle view log button clicks
         def on_view_log(e: Any) -> None:
@@ -248,14 +302,99 @@ class LeaderboardTable:
 
         self.table.on("view_log", on_view_log)
 
+        # Load the next page when the last loaded row scrolls into view
+        def on_virtual_scroll(e: Any) -> None:
+            """Handle virtual scroll events of the table."""
+            if self._has_more and self.table and e.args["to"] >= len(self.table.rows) - 1:
+                self._load_more()
+
+        self.table.on("virtual-scroll", on_virtual_scroll, ["to"])
+
+    def _fetch_rows(self, limit: int = LEADERBOARD_PAGE_SIZE) -> list[dict[str, Any]]:
+        """Query the top of the current task's leaderboard and build the table rows.
+
+        Args:
+            limit: Number of entries to fetch
+
+        Returns:
+            Table rows in rank order (empty if there are no evaluations yet)
+        """
+        if not self.task_id:
+            return []
+
+        # Version read first, so a concurrent write makes the next refresh
+        # re-render rather than being missed
+        data_version = self.repository.data_version
+        leaderboard_entries = self.repository.get_leaderboard(self.task_id, limit=limit)
+        self._rendered_version = (self.task_id, data_version)
+        self._entries_by_exec_id = {}
+        self._last_entry = None
+
+        return self._add_entries(leaderboard_entries, limit, first_rank=1)
+
+    def _load_more(self) -> None:
+        """Append the next page of the leaderboard to the table."""
+        if not self.task_id or self.table is None or self._last_entry is None:
+            return
+
+        leaderboard_entries = self.repository.get_leaderboard(
+            self.task_id, limit=LEADERBOARD_PAGE_SIZE, after=self._last_entry
+        )
+        rows = self._add_entries(
+            leaderboard_entries, LEADERBOARD_PAGE_SIZE, first_rank=len(self.table.rows) + 1
+        )
+        if rows:
+            self.table.rows = [*self.table.rows, *rows]
+
+    def _add_entries(
+        self, leaderboard_entries: list[dict[str, Any]], limit: int, first_rank: int
+    ) -> list[dict[str, Any]]:
+        """Record a fetched page of entries and build its table rows.
+
+        Args:
+            leaderboard_entries: Entries as returned by get_leaderboard()
+            limit: Page size the entries were fetched with
+            first_rank: Rank of the first entry
+
+        Returns:
+            Table rows for the entries
+        """
+        self._entries_by_exec_id.update(
+            (entry["execution_id"], entry) for entry in leaderboard_entries
+        )
+        if leaderboard_entries:
+            self._last_entry = leaderboard_entries[-1]
+        self._has_more = len(leaderboard_entries) == limit
+
+        return [
+            {
+                "rank": rank,
+                "provider": entry["model_provider"],
+                "model_name": entry["model_name"],
+                "score": entry.get("score") or "N/A",
+                "duration": format_duration(entry.get("duration_seconds")),
+                "tokens": entry.get("token_count") or "N/A",
+                "explanation": _explanation_preview(entry.get("evaluation_text")),
+                "execution_id": entry["execution_id"],
+                "actions": "",  # Placeholder for actions column
+            }
+            for rank, entry in enumerate(leaderboard_entries, start=first_rank)
+        ]
+
     def _show_execution_log_modal(self, execution_id: int) -> None:
         """Show execution log modal for the given execution.
 
         Args:
             execution_id: ID of the execution to show log for
         """
-        # Fetch execution from database
-        execution = self.repository.get_execution(execution_id)
+        # The leaderboard query already returned everything the log needs;
+        # only executions missing from it are fetched from the database
+        entry = self._entries_by_exec_id.get(execution_id)
+        execution = (
+            self._execution_from_entry(entry)
+            if entry is not None
+            else self.repository.get_execution(execution_id)
+        )
 
         if not execution:
             ui.notify("Execution not found", type="negative")
@@ -263,11 +402,31 @@ class LeaderboardTable:
 
         # Create modal dialog
         with ui.dialog() as dialog, ui.card().classes("w-full max-w-4xl"):
-            ui.label(f"Execution Log: {execution.model_provider}/{execution.model_name}").classes(
-                "text-h6"
-            )
+            ui.label(f"Execution Log: {execution.model_identifier}").classes("text-h6")
             ui.label(f"Status: {execution.status}").classes("text-caption text-grey-7")
 
+            explanation = entry.get("evaluation_text") if entry is not None else None
+
+            # Response and evaluation are only rendered once the details are opened
+            with ui.expansion("Details", icon="info").classes("w-full") as details:
+                details_column = ui.column().classes("w-full gap-2")
+
+            def show_details(e: Any) -> None:
+                """Fill in the details on first open."""
+                if not e.value or details_column.default_slot.children:
+                    return
+                with details_column:
+                    ui.label("Agent Response").classes("font-bold")
+                    response_text = get_agent_response(execution)
+                    ui.label(response_text or "No response available").classes(
+                        "text-body2 whitespace-pre-wrap"
+                    )
+                    if explanation:
+                        ui.label("Evaluation").classes("font-bold")
+                        ui.label(explanation).classes("text-body2 whitespace-pre-wrap")
+
+            details.on_value_change(show_details)
+
             # Create execution log component
             create_execution_log(execution)
 
@@ -277,26 +436,82 @@ class LeaderboardTable:
 
         dialog.open()
 
+    @staticmethod
+    def _execution_from_entry(entry: dict[str, Any]) -> AgentExecution:
+        """Build the execution shown in the log dialog from a leaderboard entry.
+
+        Args:
+            entry: Leaderboard entry as returned by get_leaderboard()
+
+        Returns:
+            AgentExecution with the fields the execution log uses
+        """
+        return AgentExecution(
+            id=entry["execution_id"],
+            task_id=entry["task_id"],
+            model_provider=entry["model_provider"],
+            model_name=entry["model_name"],
+            status=entry["status"],
+            duration_seconds=entry["duration_seconds"],
+            token_count=entry["token_count"],
+            all_messages_json=entry["all_messages"],
+        )
+
     def update_task(self, task_id: int) -> None:
         """Update the leaderboard for a different task.
 
+        The existing table is reused and only gets the rows of the new task;
+        it is rebuilt only when switching from or to the empty state.
+
         Args:
             task_id: New task ID to display leaderboard for
         """
         self.task_id = task_id
-        if self.container:
-            self.container.clear()
-            with self.container:
-                ui.label("Leaderboard").classes("text-h6")
-                self._render_leaderboard()
+        self.refresh()
 
     def refresh(self) -> None:
-        """Refresh the leaderboard display with latest data."""
-        if self.task_id and self.container:
-            self.container.clear()
-            with self.container:
-                ui.label("Leaderboard").classes("text-h6")
-                self._render_leaderboard()
+        """Refresh the leaderboard display with latest data.
+
+        Does nothing if the database has not changed since the leaderboard of
+        the current task was rendered. Otherwise the rows of the existing table
+        are replaced in place, so the browser only patches the changed cells.
+        """
+        if not self.task_id or not self.container or self._is_current():
+            return
+
+        # Keep the pages loaded so far, so the scroll position is not lost
+        same_task = self._rendered_version is not None and self._rendered_version[0] == self.task_id
+        loaded = len(self.table.rows) if self.table is not None and same_task else 0
+        rows = self._fetch_rows(max(loaded, LEADERBOARD_PAGE_SIZE))
+        if self.table is not None and rows:
+            # Writes for other tasks also bump the data version; only send
+            # rows that actually differ from the displayed ones
+            if rows != self.table.rows:
+                self.table.rows = rows
+        else:
+            self._rebuild(rows)
+
+    def _rebuild(self, rows: list[dict[str, Any]] | None = None) -> None:
+        """Clear the container and render the leaderboard from scratch.
+
+        Args:
+            rows: Table rows already fetched by the caller, queried if omitted
+        """
+        if self.container is None:
+            return
+
+        self.container.clear()
+        with self.container:
+            ui.label("Leaderboard").classes("text-h6")
+            self._render_leaderboard(rows)
+
+    def _is_current(self) -> bool:
+        """Check whether the rendered leaderboard is up to date.
+
+        Returns:
+            True if the current task was rendered and no write happened since
+        """
+        return self._rendered_version == (self.task_id, self.repository.data_version)
 
 
 def create_leaderboard_table(
@@ -3,12 +3,17 @@
 This module provides UI components for configuring AI models and application settings.
 """
 
+import functools
 from collections.abc import Callable
 
-from nicegui import ui
+from nicegui import binding, ui
 
 from src.config.models import AppConfig, EvaluationConfig, ModelConfig
 
+# Delay before typed text is sent to the server. Values are only read on save,
+# so there is no need to round-trip every keystroke; Quasar flushes on blur.
+INPUT_DEBOUNCE_MS = 300
+
 
 class ModelConfigForm:
     """Form for configuring a single AI model.
@@ -16,6 +21,15 @@ class ModelConfigForm:
     Provides inputs for provider, model name, and API key environment variable.
     """
 
+    __slots__ = (
+        "model_config",
+        "on_remove",
+        "provider_select",
+        "model_input",
+        "api_key_env_input",
+        "container",
+    )
+
     def __init__(
         self,
         model_config: ModelConfig | None = None,
@@ -48,18 +62,26 @@ class ModelConfigForm:
                 ).classes("w-1/4")
 
                 # Model name
-                self.model_input = ui.input(
-                    label="Model Name",
-                    placeholder="e.g., gpt-4o, llama-3.3-70b-versatile",
-                    value=self.model_config.model if self.model_config else "",
-                ).classes("w-1/3")
+                self.model_input = (
+                    ui.input(
+                        label="Model Name",
+                        placeholder="e.g., gpt-4o, llama-3.3-70b-versatile",
+                        value=self.model_config.model if self.model_config else "",
+                    )
+                    .classes("w-1/3")
+                    .props(f"debounce={INPUT_DEBOUNCE_MS}")
+                )
 
                 # API key env var
-                self.api_key_env_input = ui.input(
-                    label="API Key Env Var",
-                    placeholder="e.g., OPENAI_API_KEY",
-                    value=self.model_config.api_key_env if self.model_config else "",
-                ).classes("w-1/3")
+                self.api_key_env_input = (
+                    ui.input(
+                        label="API Key Env Var",
+                        placeholder="e.g., OPENAI_API_KEY",
+                        value=self.model_config.api_key_env if self.model_config else "",
+                    )
+                    .classes("w-1/3")
+                    .props(f"debounce={INPUT_DEBOUNCE_MS}")
+                )
 
                 # Remove button (if callback provided)
                 if self.on_remove:
@@ -93,6 +115,10 @@ class SettingsForm:
     Manages task agents, evaluation agent, execution settings, and database config.
     """
 
+    # Number of task agent forms. A bindable property pushes changes to the
+    # "Add Task Agent" button when they happen instead of being polled.
+    _agent_count = binding.BindableProperty()
+
     def __init__(self, config: AppConfig):
         """Initialize settings form.
 
@@ -100,7 +126,10 @@ class SettingsForm:
             config: Current application configuration
         """
         self.config = config
-        self.task_agent_forms: list[ModelConfigForm] = []
+        # Task agent forms in display order, keyed by a per-form counter
+        self.task_agent_forms: dict[int, ModelConfigForm] = {}
+        self._next_form_key = 0
+        self._agent_count = 0
         self.eval_agent_form: ModelConfigForm | None = None
         self.timeout_input: ui.number | None = None
         self.db_path_input: ui.input | None = None
@@ -125,9 +154,9 @@ class SettingsForm:
                 self._add_task_agent_form(agent_config)
 
         # Add agent button
-        ui.button("Add Task Agent", icon="add", on_click=self._add_task_agent_form).props(
+        ui.button("Add Task Agent", icon="add", on_click=lambda: self._add_task_agent_form()).props(
             "outline color=primary"
-        ).bind_enabled_from(self, "task_agent_forms", backward=lambda forms: len(forms) < 5)
+        ).bind_enabled_from(self, "_agent_count", backward=lambda count: count < 5)
 
         # Evaluation Agent Section
         ui.label("Evaluation Agent").classes("text-h6 mt-6")
@@ -152,26 +181,34 @@ class SettingsForm:
                 placeholder="Use {task_prompt} and {agent_response} placeholders",
             )
             .classes("w-full")
-            .props("rows=5")
+            .props(f"rows=5 debounce={INPUT_DEBOUNCE_MS}")
         )
 
         # Execution Settings Section
         ui.label("Execution Settings").classes("text-h6 mt-6")
 
         with ui.row().classes("w-full gap-4"):
-            self.timeout_input = ui.number(
-                label="Timeout (seconds)",
-                value=self.config.execution.timeout_seconds,
-                min=1,
-                max=600,
-                step=1,
-            ).classes("w-1/3")
-
-            self.db_path_input = ui.input(
-                label="Database Path",
-                value=self.config.database.path,
-                placeholder="e.g., agent_leaderboard.duckdb",
-            ).classes("w-2/3")
+            self.timeout_input = (
+                ui.number(
+                    label="Timeout (seconds)",
+                    value=self.config.execution.timeout_seconds,
+                    min=1,
+                    max=600,
+                    step=1,
+                )
+                .classes("w-1/3")
+                .props(f"debounce={INPUT_DEBOUNCE_MS}")
+            )
+
+            self.db_path_input = (
+                ui.input(
+                    label="Database Path",
+                    value=self.config.database.path,
+                    placeholder="e.g., agent_leaderboard.duckdb",
+                )
+                .classes("w-2/3")
+                .props(f"debounce={INPUT_DEBOUNCE_MS}")
+            )
 
     def _add_task_agent_form(self, model_config: ModelConfig | None = None) -> None:
         """Add a task agent form to the list.
@@ -182,18 +219,30 @@ class SettingsForm:
         if not self.task_agents_container:
             raise RuntimeError("Task agents container not initialized")
 
-        def remove_form() -> None:
-            # Find and remove this form
-            if form in self.task_agent_forms:
-                self.task_agent_forms.remove(form)
-                if form.container:
-                    form.container.delete()
+        key = self._next_form_key
+        self._next_form_key += 1
 
         with self.task_agents_container:
-            on_remove_callback = remove_form if len(self.task_agent_forms) >= 2 else None
+            on_remove_callback = (
+                functools.partial(self._remove_task_agent_form, key)
+                if len(self.task_agent_forms) >= 2
+                else None
+            )
             form = ModelConfigForm(model_config, on_remove=on_remove_callback)
             form.create()
-            self.task_agent_forms.append(form)
+            self.task_agent_forms[key] = form
+            self._agent_count = len(self.task_agent_forms)
+
+    def _remove_task_agent_form(self, key: int) -> None:
+        """Remove a task agent form.
+
+        Args:
+            key: Key of the form in task_agent_forms
+        """
+        form = self.task_agent_forms.pop(key, None)
+        self._agent_count = len(self.task_agent_forms)
+        if form is not None and form.container:
+            form.container.delete()
 
     def get_config(self) -> AppConfig:
         """Get the application configuration from form inputs.
@@ -212,7 +261,7 @@ class SettingsForm:
 
         # Collect task agents
         task_agents = []
-        for form in self.task_agent_forms:
+        for form in self.task_agent_forms.values():
             task_agents.append(form.get_config())
 
         # Get evaluation agent
@@ -243,7 +292,10 @@ class SettingsForm:
         from src.config.models import DatabaseConfig, ExecutionConfig
 
         return AppConfig(
-            execution=ExecutionConfig(timeout_seconds=int(self.timeout_input.value)),
+            execution=ExecutionConfig(
+                timeout_seconds=int(self.timeout_input.value),
+                max_concurrency=self.config.execution.max_concurrency,
+            ),
             task_agents=task_agents,
             evaluation_agent=evaluation_agent,
             database=DatabaseConfig(path=str(self.db_path_input.value)),
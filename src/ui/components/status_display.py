@@ -8,6 +8,22 @@ from nicegui import ui
 from src.execution.state import MultiAgentExecutionState
 from src.models.execution import ExecutionStatus
 
+# Badge color per execution status
+_STATUS_COLORS: dict[ExecutionStatus, str] = {
+    ExecutionStatus.RUNNING: "blue",
+    ExecutionStatus.COMPLETED: "green",
+    ExecutionStatus.FAILED: "red",
+    ExecutionStatus.TIMEOUT: "orange",
+}
+
+# Material icon per execution status
+_STATUS_ICONS: dict[ExecutionStatus, str] = {
+    ExecutionStatus.RUNNING: "sync",
+    ExecutionStatus.COMPLETED: "check_circle",
+    ExecutionStatus.FAILED: "error",
+    ExecutionStatus.TIMEOUT: "schedule",
+}
+
 
 def get_status_color(status: ExecutionStatus) -> str:
     """Get color code for execution status.
@@ -18,13 +34,7 @@ def get_status_color(status: ExecutionStatus) -> str:
     Returns:
         Color name for status display
     """
-    color_map = {
-        ExecutionStatus.RUNNING: "blue",
-        ExecutionStatus.COMPLETED: "green",
-        ExecutionStatus.FAILED: "red",
-        ExecutionStatus.TIMEOUT: "orange",
-    }
-    return color_map.get(status, "grey")
+    return _STATUS_COLORS.get(status, "grey")
 
 
 def get_status_icon(status: ExecutionStatus) -> str:
@@ -36,13 +46,7 @@ def get_status_icon(status: ExecutionStatus) -> str:
     Returns:
         Material icon name
     """
-    icon_map = {
-        ExecutionStatus.RUNNING: "sync",
-        ExecutionStatus.COMPLETED: "check_circle",
-        ExecutionStatus.FAILED: "error",
-        ExecutionStatus.TIMEOUT: "schedule",
-    }
-    return icon_map.get(status, "help")
+    return _STATUS_ICONS.get(status, "help")
 
 
 class ExecutionStatusDisplay:
@@ -60,6 +64,7 @@ class ExecutionStatusDisplay:
         """
         self.execution_state = execution_state
         self.status_labels: dict[str, ui.label] = {}
+        self.status_icons: dict[str, ui.icon] = {}
         self.container: ui.card | None = None
 
     def create(self) -> None:
@@ -83,7 +88,7 @@ class ExecutionStatusDisplay:
                 # Status icon
                 icon = get_status_icon(agent_state.status)
                 color = get_status_color(agent_state.status)
-                ui.icon(icon).props(f"color={color}")
+                self.status_icons[identifier] = ui.icon(icon).props(f"color={color}")
 
                 # Model identifier
                 ui.label(identifier).classes("font-bold")
@@ -106,12 +111,32 @@ class ExecutionStatusDisplay:
             with self.container:
                 ui.label("Execution Status").classes("text-h6")
                 self.status_labels.clear()
+                self.status_icons.clear()
                 self._render_status()
 
+    def patch_row(self, model_identifier: str, status: ExecutionStatus) -> None:
+        """Show a new status for one agent without re-rendering the display.
+
+        Args:
+            model_identifier: Agent identifier in "provider/model" form
+            status: New execution status of the agent
+        """
+        status_label = self.status_labels.get(model_identifier)
+        status_icon = self.status_icons.get(model_identifier)
+        if status_label is None or status_icon is None:
+            return
+
+        color = get_status_color(status)
+        status_icon.name = get_status_icon(status)
+        status_icon.props(f"color={color}")
+        status_label.text = status.value
+        status_label.props(f"color={color}")
+
     def clear(self) -> None:
         """Clear the status display."""
         self.execution_state = None
         self.status_labels.clear()
+        self.status_icons.clear()
         if self.container:
             self.container.clear()
             with self.container:
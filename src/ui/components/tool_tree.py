@@ -4,53 +4,101 @@ This module provides a UI component for displaying tool call hierarchies.
 Shows tool calls, arguments, results, and nested calls in a tree structure.
 """
 
+import functools
 from typing import Any
 
 from nicegui import ui
 from nicegui.events import ValueChangeEventArguments
 
-from src.execution.executor import ToolCallNode, extract_tool_hierarchy, format_tool_call
+from src.execution.executor import ToolCallNode, format_tool_call, parse_tool_hierarchy
 from src.models.execution import AgentExecution
 
+# Maximum number of tree structures kept in memory
+_TREE_CACHE_SIZE = 64
+
 
 def build_tree_structure(nodes: list[ToolCallNode]) -> list[dict[str, Any]]:
     """Build tree structure for NiceGUI ui.tree.
 
+    Uses an explicit stack instead of recursion, like calculate_tree_depth(),
+    so deep traces neither hit the recursion limit nor pay per-call overhead.
+
     Args:
         nodes: List of tool call nodes
 
     Returns:
         Tree structure compatible with ui.tree()
     """
-    if not nodes:
-        return []
-
-    def node_to_tree(node: ToolCallNode) -> dict[str, Any]:
-        """Convert ToolCallNode to ui.tree dict structure."""
-        # Format node label
-        label = format_tool_call(node, max_result_length=50)
-
+    tree: list[dict[str, Any]] = []
+    # (node, list its tree node is appended to), popped in display order
+    stack: list[tuple[ToolCallNode, list[dict[str, Any]]]] = [
+        (node, tree) for node in reversed(nodes)
+    ]
+
+    while stack:
+        node, siblings = stack.pop()
         tree_node: dict[str, Any] = {
             "id": node["call_id"],
-            "label": label,
+            "label": format_tool_call(node, max_result_length=50),
             "icon": "function",
         }
+        siblings.append(tree_node)
 
-        # Add children recursively
         if node["children"]:
-            tree_node["children"] = [node_to_tree(child) for child in node["children"]]
+            children: list[dict[str, Any]] = []
+            tree_node["children"] = children
+            stack.extend((child, children) for child in reversed(node["children"]))
+
+    return tree
+
+
+@functools.lru_cache(maxsize=_TREE_CACHE_SIZE)
+def _tree_data(messages_json: str | None) -> tuple[list[dict[str, Any]], list[str]]:
+    """Get the tree structure of the tool calls in a messages JSON string.
+
+    Cached by message content, so switching back to an execution (in any
+    client) does not parse its messages again. The returned lists are shared
+    and must not be modified.
+
+    Args:
+        messages_json: Pydantic AI all_messages output as JSON string
+
+    Returns:
+        Tree structure compatible with ui.tree() (empty if there are no tool
+        calls) and the IDs of the nodes that have children, i.e. the nodes to
+        expand so the whole tree is open
+
+    Raises:
+        ValueError: If the tool calls cannot be extracted from the messages
+    """
+    tree_data = build_tree_structure(parse_tool_hierarchy(messages_json))
 
-        return tree_node
+    expanded_ids: list[str] = []
+    stack = list(tree_data)
+    while stack:
+        node = stack.pop()
+        if "children" in node:
+            expanded_ids.append(node["id"])
+            stack.extend(node["children"])
 
-    return [node_to_tree(node) for node in nodes]
+    return tree_data, expanded_ids
 
 
 class ToolCallTree:
     """Tool call tree component.
 
-    Displays tool call hierarchy in an expandable tree structure.
+    Displays tool call hierarchy in an expandable tree structure. The tree and
+    its status message are created once; switching executions only replaces
+    the tree nodes and the message text.
     """
 
+    __slots__ = (
+        "execution",
+        "container",
+        "tree",
+        "_message",
+    )
+
     def __init__(self, execution: AgentExecution | None = None):
         """Initialize tool call tree.
 
@@ -60,6 +108,7 @@ class ToolCallTree:
         self.execution = execution
         self.container: ui.card | None = None
         self.tree: ui.tree | None = None
+        self._message: ui.label | None = None
 
     def create(self) -> None:
         """Create the tool call tree UI component."""
@@ -67,62 +116,74 @@ class ToolCallTree:
             self.container = card
             ui.label("Tool Calls").classes("text-h6")
 
-            if self.execution:
-                self._render_tree()
-            else:
-                ui.label("No execution selected").classes("text-grey-6")
+            self._message = ui.label()
+            self.tree = ui.tree(
+                nodes=[],
+                label_key="label",
+                children_key="children",
+                node_key="id",
+            ).classes("w-full")
+
+            self._render_tree()
 
     def _render_tree(self) -> None:
-        """Render tool call tree for the current execution."""
-        if not self.execution:
+        """Show the tool call tree (or a status message) for the current execution."""
+        if self.tree is None or self._message is None:
             return
 
-        # Extract tool hierarchy
-        try:
-            tool_nodes = extract_tool_hierarchy(self.execution)
-        except ValueError as e:
-            ui.label(f"Failed to extract tool calls: {e}").classes("text-red-600")
-            return
+        tree_data: list[dict[str, Any]] = []
+        expanded_ids: list[str] = []
+        if not self.execution:
+            self._show_message("No execution selected")
+        else:
+            try:
+                tree_data, expanded_ids = _tree_data(self.execution.all_messages_json)
+            except ValueError as e:
+                self._show_message(f"Failed to extract tool calls: {e}", error=True)
+            else:
+                if tree_data:
+                    self._message.set_visibility(False)
+                else:
+                    self._show_message("No tool calls found")
+
+        # Replace the nodes and expand all of them by default. The expanded IDs
+        # are set as one prop (copied, ui.tree updates the list in place)
+        # instead of expand() collecting the keys of every node.
+        self.tree._props["nodes"] = tree_data
+        self.tree._props["expanded"] = list(expanded_ids)
+        self.tree.set_visibility(bool(tree_data))
+        self.tree.update()
+
+    def _show_message(self, text: str, error: bool = False) -> None:
+        """Show a status message in place of the tree.
 
-        if not tool_nodes:
-            ui.label("No tool calls found").classes("text-grey-6")
+        Args:
+            text: Message text
+            error: Whether the message reports an error
+        """
+        if self._message is None:
             return
 
-        # Build tree structure
-        tree_data = build_tree_structure(tool_nodes)
+        self._message.set_text(text)
+        self._message.classes(replace="text-red-600" if error else "text-grey-6")
+        self._message.set_visibility(True)
 
-        # Create tree
-        self.tree = ui.tree(
-            nodes=tree_data,
-            label_key="label",
-            children_key="children",
-            node_key="id",
-        ).classes("w-full")
-
-        # Expand all nodes by default
-        if self.tree:
-            self.tree.expand()
-
-    def update_execution(self, execution: AgentExecution) -> None:
+    def update_execution(self, execution: AgentExecution | None) -> None:
         """Update the tree for a different execution.
 
         Args:
             execution: New execution to display tool calls for
         """
+        if execution is self.execution:
+            return
+
         self.execution = execution
-        if self.container:
-            self.container.clear()
-            with self.container:
-                ui.label("Tool Calls").classes("text-h6")
-                self._render_tree()
+        self._render_tree()
 
     def refresh(self) -> None:
         """Refresh the tree display with latest data."""
-        if self.execution and self.container:
-            self.container.clear()
-            with self.container:
-                ui.label("Tool Calls").classes("text-h6")
-                self._render_tree()
+        if self.execution:
+            self._render_tree()
 
 
 class ToolCallTreePanel:
@@ -131,6 +192,17 @@ class ToolCallTreePanel:
     Displays tool calls for a selected execution from a list.
     """
 
+    __slots__ = (
+        "executions",
+        "selected_execution",
+        "container",
+        "tree_component",
+        "_select",
+        "_empty_label",
+        "_execution_options",
+        "_labels_by_execution",
+    )
+
     def __init__(self, executions: list[AgentExecution] | None = None):
         """Initialize tool call tree panel.
 
@@ -141,52 +213,77 @@ class ToolCallTreePanel:
         self.selected_execution: AgentExecution | None = None
         self.container: ui.card | None = None
         self.tree_component: ToolCallTree | None = None
+        self._select: ui.select | None = None
+        self._empty_label: ui.label | None = None
+        # "provider/model" label -> execution, for the selector
+        self._execution_options: dict[str, AgentExecution] = {}
+        # id(execution) -> selector label
+        self._labels_by_execution: dict[int, str] = {}
 
     def _create_ui_content(self) -> None:
         """Create UI content for the tool call tree panel.
 
-        This is used both by create() for initial setup and update_executions()
-        for updating with new data.
+        The widgets are created once; update_executions() only changes the
+        selector options and the displayed tree.
         """
-        if not self.executions:
-            ui.label("No executions available").classes("text-grey-6")
-            return
-
-        # Create execution selector
-        execution_options = {
-            f"{exec.model_provider}/{exec.model_name}": exec for exec in self.executions
-        }
-
-        # Auto-select first execution if only one is available
-        if len(self.executions) == 1:
-            first_label = list(execution_options.keys())[0]
-            self.selected_execution = execution_options[first_label]
+        self._empty_label = ui.label("No executions available").classes("text-grey-6")
 
         def on_select(e: ValueChangeEventArguments) -> None:
             selected_label = e.value
-            if selected_label and selected_label in execution_options:
-                self.selected_execution = execution_options[selected_label]
+            if selected_label and selected_label in self._execution_options:
+                self.selected_execution = self._execution_options[selected_label]
                 if self.tree_component:
                     self.tree_component.update_execution(self.selected_execution)
 
-        # Create selector with auto-selected value if available
-        select_widget = ui.select(
-            options=list(execution_options.keys()),
+        self._select = ui.select(
+            options=[],
             label="Select Execution",
             on_change=on_select,
         ).classes("w-full")
 
-        # Set the default selection if we have a pre-selected execution
-        if self.selected_execution:
-            default_label = (
-                f"{self.selected_execution.model_provider}/{self.selected_execution.model_name}"
-            )
-            select_widget.value = default_label
-
         # Create tree component
         self.tree_component = ToolCallTree(self.selected_execution)
         self.tree_component.create()
 
+        self._show_executions()
+
+    def _show_executions(self) -> None:
+        """Update the selector and tree for the current list of executions."""
+        if self._select is None or self._empty_label is None or self.tree_component is None:
+            return
+
+        has_executions = bool(self.executions)
+        self._empty_label.set_visibility(not has_executions)
+        self._select.set_visibility(has_executions)
+        if self.tree_component.container is not None:
+            self.tree_component.container.set_visibility(has_executions)
+
+        # Create execution selector options (labels are formatted once per update)
+        self._execution_options = {}
+        self._labels_by_execution = {}
+        label_counts: dict[str, int] = {}
+        for execution in self.executions:
+            label = execution.model_identifier
+            # Number repeated runs of the same model so each stays selectable
+            count = label_counts[label] = label_counts.get(label, 0) + 1
+            if count > 1:
+                label = f"{label} #{count}"
+            self._execution_options[label] = execution
+            self._labels_by_execution[id(execution)] = label
+
+        # Auto-select first execution if only one is available
+        if len(self.executions) == 1:
+            self.selected_execution = self.executions[0]
+
+        # Set the default selection if we have a pre-selected execution
+        default_label = (
+            self._labels_by_execution.get(id(self.selected_execution))
+            if self.selected_execution
+            else None
+        )
+        self._select.set_options(list(self._execution_options), value=default_label)
+        self.tree_component.update_execution(self.selected_execution)
+
     def create(self) -> None:
         """Create the tool call tree panel UI component."""
         with ui.card().classes("w-full") as card:
@@ -202,11 +299,7 @@ class ToolCallTreePanel:
         """
         self.executions = executions
         self.selected_execution = None
-        if self.container:
-            self.container.clear()
-            with self.container:
-                ui.label("Tool Call Analysis").classes("text-h6")
-                self._create_ui_content()
+        self._show_executions()
 
 
 def create_tool_call_tree(execution: AgentExecution | None = None) -> ToolCallTree:
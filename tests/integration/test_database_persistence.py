@@ -3,9 +3,16 @@
 Tests for performance metrics aggregation and database query operations.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
+import duckdb
 import pytest
 
 from src.database.connection import DatabaseConnection
+from src.database.repositories import TaskRepository
+from src.models.evaluation import EvaluationResult
+from src.models.execution import AgentExecution
+from src.models.task import TaskSubmission
 
 
 @pytest.fixture
@@ -222,3 +229,222 @@ class TestTaskHistoryQuery:
         """
         # This test will be implemented after T069
         pass
+
+
+@pytest.mark.integration
+class TestTaskHistoryPagination:
+    """Tests for paginated task history queries."""
+
+    def test_pages_cover_history_in_order(self, temp_db: DatabaseConnection) -> None:
+        """Test that limit/offset pages return consecutive slices of the history."""
+        repo = TaskRepository(temp_db)
+        for i in range(5):
+            repo.create_task(TaskSubmission(prompt=f"Task {i}"))
+
+        full = repo.get_task_history()
+        pages = repo.get_task_history(limit=2) + repo.get_task_history(limit=2, offset=2)
+
+        assert repo.count_tasks() == 5
+        assert [t["id"] for t in pages] == [t["id"] for t in full[:4]]
+
+    def test_sort_by_id_ascending(self, temp_db: DatabaseConnection) -> None:
+        """Test sorting the history by another column."""
+        repo = TaskRepository(temp_db)
+        ids = [repo.create_task(TaskSubmission(prompt=f"Task {i}")) for i in range(3)]
+
+        history = repo.get_task_history(sort_by="id", descending=False)
+
+        assert [t["id"] for t in history] == ids
+
+    def test_prompt_preview_truncated_by_query(self, temp_db: DatabaseConnection) -> None:
+        """Test that long prompts are shortened to the preview length."""
+        repo = TaskRepository(temp_db)
+        repo.create_task(TaskSubmission(prompt="x" * 100))
+        repo.create_task(TaskSubmission(prompt="short"))
+
+        previews = {t["prompt"] for t in repo.get_task_history(prompt_preview_length=60)}
+
+        assert previews == {"x" * 57 + "...", "short"}
+
+    def test_unknown_sort_column_rejected(self, temp_db: DatabaseConnection) -> None:
+        """Test that only whitelisted columns can be used for sorting."""
+        repo = TaskRepository(temp_db)
+
+        with pytest.raises(ValueError, match="sort task history"):
+            repo.get_task_history(sort_by="prompt; DROP TABLE task_submissions")
+
+
+@pytest.mark.integration
+class TestLeaderboardPagination:
+    """Tests for keyset-paginated leaderboard queries."""
+
+    def test_pages_follow_rank_order(self, temp_db: DatabaseConnection) -> None:
+        """Test that pages continue after the last entry, including tied and missing durations."""
+        repo = TaskRepository(temp_db)
+        task_id = repo.create_task(TaskSubmission(prompt="Ranked task"))
+        for score, duration in [(90, 2.0), (80, None), (90, 1.0), (80, 3.0), (90, 2.0)]:
+            execution = AgentExecution(task_id=task_id, model_provider="groq", model_name="m")
+            execution.duration_seconds = duration
+            execution_id = repo.create_execution(execution)
+            repo.create_evaluation(
+                EvaluationResult(execution_id=execution_id, score=score, explanation="ok")
+            )
+
+        full = repo.get_leaderboard(task_id)
+        pages = repo.get_leaderboard(task_id, limit=2)
+        while len(pages) < len(full):
+            pages += repo.get_leaderboard(task_id, limit=2, after=pages[-1])
+
+        assert [(e["score"], e["duration_seconds"]) for e in full] == [
+            (90, 1.0),
+            (90, 2.0),
+            (90, 2.0),
+            (80, 3.0),
+            (80, None),
+        ]
+        assert [e["execution_id"] for e in pages] == [e["execution_id"] for e in full]
+        assert repo.get_leaderboard(task_id, after=full[-1]) == []
+
+
+@pytest.mark.integration
+class TestBatchExecutionPersistence:
+    """Tests for persisting multi-agent results in a single transaction."""
+
+    def test_create_executions_returns_ids_in_order(self, temp_db: DatabaseConnection) -> None:
+        """Test that batch insert persists all executions and preserves order."""
+        repo = TaskRepository(temp_db)
+        task_id = repo.create_task(TaskSubmission(prompt="Batch task"))
+
+        executions = [
+            AgentExecution(task_id=task_id, model_provider="openai", model_name="gpt-4o"),
+            AgentExecution(task_id=task_id, model_provider="groq", model_name="qwen3-32b"),
+        ]
+        for execution in executions:
+            execution.mark_completed()
+
+        execution_ids = repo.create_executions(executions)
+
+        assert len(execution_ids) == 2
+        for execution, execution_id in zip(executions, execution_ids, strict=True):
+            stored = repo.get_execution(execution_id)
+            assert stored is not None
+            assert stored.model_name == execution.model_name
+
+    def test_create_executions_empty_list(self, temp_db: DatabaseConnection) -> None:
+        """Test that an empty batch is a no-op."""
+        repo = TaskRepository(temp_db)
+
+        assert repo.create_executions([]) == []
+
+    def test_create_executions_rolls_back_on_failure(self, temp_db: DatabaseConnection) -> None:
+        """Test that a failing row leaves no partial batch behind."""
+        repo = TaskRepository(temp_db)
+        task_id = repo.create_task(TaskSubmission(prompt="Batch task"))
+
+        valid = AgentExecution(task_id=task_id, model_provider="openai", model_name="gpt-4o")
+        # Unknown task_id violates the foreign key constraint
+        invalid = AgentExecution(task_id=task_id + 999, model_provider="groq", model_name="x")
+
+        with pytest.raises(duckdb.Error):
+            repo.create_executions([valid, invalid])
+
+        assert repo.get_executions_for_task(task_id) == []
+
+    def test_create_evaluations_in_one_transaction(self, temp_db: DatabaseConnection) -> None:
+        """Test that batch evaluation insert persists every score."""
+        repo = TaskRepository(temp_db)
+        task_id = repo.create_task(TaskSubmission(prompt="Batch task"))
+        executions = [
+            AgentExecution(task_id=task_id, model_provider="openai", model_name="gpt-4o"),
+            AgentExecution(task_id=task_id, model_provider="groq", model_name="qwen3-32b"),
+        ]
+        execution_ids = repo.create_executions(executions)
+
+        evaluation_ids = repo.create_evaluations(
+            [
+                EvaluationResult(execution_id=execution_id, score=score, explanation="ok")
+                for execution_id, score in zip(execution_ids, [70, 90], strict=True)
+            ]
+        )
+
+        assert len(evaluation_ids) == 2
+        scores = {entry["execution_id"]: entry["score"] for entry in repo.get_leaderboard(task_id)}
+        assert scores == dict(zip(execution_ids, [70, 90], strict=True))
+        assert repo.create_evaluations([]) == []
+
+
+@pytest.mark.integration
+class TestConnectionPool:
+    """Tests for pooled connections handed out by DatabaseConnection.acquire()."""
+
+    def test_pooled_connection_sees_committed_writes(self, temp_db: DatabaseConnection) -> None:
+        """Test that pooled connections share the primary connection's database."""
+        repo = TaskRepository(temp_db)
+        task_id = repo.create_task(TaskSubmission(prompt="Pooled read"))
+
+        with temp_db.acquire() as conn:
+            row = conn.execute(
+                "SELECT prompt FROM task_submissions WHERE id = ?", [task_id]
+            ).fetchone()
+
+        assert row == ("Pooled read",)
+
+    def test_pool_reuses_released_connections(self) -> None:
+        """Test that released connections are handed out again."""
+        db = DatabaseConnection(":memory:", pool_size=1)
+        db.initialize_schema()
+
+        with db.acquire() as first:
+            pass
+        with db.acquire() as second:
+            assert second is first
+
+        db.close()
+
+    def test_close_discards_borrowed_connections(self) -> None:
+        """Test that connections borrowed during close() are not handed out again."""
+        db = DatabaseConnection(":memory:", pool_size=1)
+        db.initialize_schema()
+
+        with db.acquire() as borrowed:
+            db.close()
+
+        with db.acquire() as conn:
+            assert conn is not borrowed
+            assert conn.execute("SELECT 1").fetchone() == (1,)
+
+        db.close()
+
+    def test_close_wakes_waiting_callers(self) -> None:
+        """Test that a caller waiting for a connection gets a new one after close()."""
+        db = DatabaseConnection(":memory:", pool_size=1)
+        db.initialize_schema()
+
+        def query() -> object:
+            with db.acquire() as conn:
+                return conn.execute("SELECT 1").fetchone()
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            with db.acquire():
+                waiting = pool.submit(query)
+                db.close()
+            assert waiting.result(timeout=5) == (1,)
+
+        db.close()
+
+    def test_concurrent_writes_from_threads(self, temp_db: DatabaseConnection) -> None:
+        """Test that repository writes from worker threads use separate connections."""
+        repo = TaskRepository(temp_db)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            task_ids = list(
+                pool.map(lambda i: repo.create_task(TaskSubmission(prompt=f"Task {i}")), range(8))
+            )
+
+        assert len(set(task_ids)) == 8
+        assert repo.count_tasks() == 8
+
+    def test_invalid_pool_size_rejected(self) -> None:
+        """Test that a pool must allow at least one connection."""
+        with pytest.raises(ValueError, match="pool_size"):
+            DatabaseConnection(":memory:", pool_size=0)
@@ -95,6 +95,7 @@ class TestAggregatedPerformanceMetrics:
         assert metrics[0]["min_duration"] == 1.0
         assert metrics[0]["max_duration"] == 3.0
         assert metrics[0]["avg_tokens"] == 150.0
+        assert metrics[0]["avg_tokens_per_sec"] == pytest.approx(75.0)
         assert metrics[0]["execution_count"] == 3
 
     def test_excludes_incomplete_executions(self, temp_db: DatabaseConnection) -> None:
@@ -201,3 +202,40 @@ class TestAggregatedPerformanceMetrics:
         assert ("anthropic", "claude-sonnet-4") in model_ids
         assert ("groq", "llama-3.3-70b-versatile") in model_ids
         assert ("groq", "qwen3-32b") in model_ids
+
+    def test_model_id_label(self, temp_db: DatabaseConnection) -> None:
+        """Test that the display identifier is built by the query."""
+        repo = TaskRepository(temp_db)
+        task_id = repo.create_task(TaskSubmission(prompt="Test task"))
+
+        execution = AgentExecution(task_id=task_id, model_provider="groq", model_name="qwen3-32b")
+        execution.mark_completed()
+        execution.duration_seconds = 1.0
+        repo.create_execution(execution)
+
+        assert repo.get_performance_metrics(task_id)[0]["model_id"] == "groq/qwen3-32b"
+        assert repo.get_performance_metrics()[0]["model_id"] == "groq/qwen3-32b"
+
+
+class TestPerformanceMetricsCache:
+    """Tests for caching of aggregated performance metrics."""
+
+    def test_cached_until_next_write(self, temp_db: DatabaseConnection) -> None:
+        """Test that metrics are served from cache and invalidated by writes."""
+        repo = TaskRepository(temp_db)
+        reader = TaskRepository(temp_db)
+        task_id = repo.create_task(TaskSubmission(prompt="Test task"))
+
+        execution = AgentExecution(task_id=task_id, model_provider="groq", model_name="qwen3-32b")
+        execution.mark_completed()
+        execution.duration_seconds = 1.0
+        repo.create_execution(execution)
+
+        first = reader.get_performance_metrics(task_id)
+        # Mutating the returned rows must not leak into the cache
+        first[0]["avg_duration"] = -1.0
+        assert reader.get_performance_metrics(task_id)[0]["avg_duration"] == 1.0
+
+        # A write through another repository on the same connection invalidates
+        repo.create_execution(execution)
+        assert reader.get_performance_metrics(task_id)[0]["execution_count"] == 2
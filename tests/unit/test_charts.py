@@ -0,0 +1,111 @@
+"""Unit tests for performance chart data preparation."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.ui.components.charts import (
+    PerformanceCharts,
+    extract_chart_series,
+    limit_chart_metrics,
+)
+
+
+def make_row(name: str, count: int, avg_duration: float = 1.0) -> dict[str, object]:
+    """Create a metrics row as returned by get_performance_metrics()."""
+    return {
+        "model_provider": "groq",
+        "model_name": name,
+        "model_id": f"groq/{name}",
+        "avg_duration": avg_duration,
+        "std_duration": 0.0,
+        "min_duration": avg_duration,
+        "max_duration": avg_duration,
+        "avg_tokens": 100.0,
+        "std_tokens": 0.0,
+        "avg_tokens_per_sec": 100.0 / avg_duration,
+        "execution_count": count,
+    }
+
+
+class TestLimitChartMetrics:
+    """Tests for merging less executed models into an "Other" row."""
+
+    def test_small_input_unchanged(self) -> None:
+        """Test that metrics within the limit are returned as is."""
+        metrics = [make_row("a", 1), make_row("b", 2)]
+
+        assert limit_chart_metrics(metrics, max_bars=2) is metrics
+
+    def test_merges_least_executed_models(self) -> None:
+        """Test that the rows beyond the limit are aggregated."""
+        metrics = [
+            make_row("a", 5),
+            make_row("b", 1, avg_duration=1.0),
+            make_row("c", 3, avg_duration=3.0),
+            make_row("d", 4),
+        ]
+
+        limited = limit_chart_metrics(metrics, max_bars=3)
+
+        assert [m["model_id"] for m in limited] == ["groq/a", "groq/d", "Other (2 models)"]
+        other = limited[-1]
+        assert other["execution_count"] == 4
+        # Weighted by execution count: (1 * 1.0 + 3 * 3.0) / 4
+        assert other["avg_duration"] == pytest.approx(2.5)
+        # Pooled over the executions: 1 * (1.5)^2 + 3 * (0.5)^2 = 3.0 over 3 degrees
+        assert other["std_duration"] == pytest.approx(1.0)
+        assert other["min_duration"] == 1.0
+        assert other["max_duration"] == 3.0
+
+    def test_invalid_limit_rejected(self) -> None:
+        """Test that the limit must leave room for at least one model and "Other"."""
+        with pytest.raises(ValueError, match="max_bars"):
+            limit_chart_metrics([], max_bars=1)
+
+
+class TestExtractChartSeries:
+    """Tests for extracting the chart series from metrics rows."""
+
+    def test_parallel_series(self) -> None:
+        """Test that every series has one entry per row, in row order."""
+        metrics = [make_row("a", 2, avg_duration=2.0), make_row("b", 1)]
+
+        series = extract_chart_series(metrics)
+
+        assert series.models == ["groq/a", "groq/b"]
+        assert series.execution_counts == [2, 1]
+        assert series.avg_durations == [2.0, 1.0]
+        assert series.tokens_per_sec == [50.0, 100.0]
+
+
+class TestPerformanceChartsRefresh:
+    """Tests for discarding the results of superseded chart refreshes."""
+
+    def test_prepare_queries_given_task(self) -> None:
+        """Test that figures are built for the task captured at scheduling time."""
+        repository = MagicMock()
+        repository.get_performance_metrics.return_value = [make_row("a", 1)]
+        charts = PerformanceCharts(repository, task_id=2)
+
+        metrics, figures = charts._prepare(1)
+
+        repository.get_performance_metrics.assert_called_once_with(1)
+        assert metrics == [make_row("a", 1)]
+        assert figures is not None
+
+    def test_superseded_refresh_discarded(self) -> None:
+        """Test that a refresh finishing after a newer one was scheduled is not shown."""
+        charts = PerformanceCharts(MagicMock(), task_id=1)
+        charts.container = MagicMock()
+        stale_generation = charts._refresh_generation
+        charts.task_id = 2
+        charts._refresh_generation += 1
+        update_charts = MagicMock(return_value=True)
+        charts._update_charts = update_charts  # type: ignore[method-assign]
+
+        charts._apply_refresh(stale_generation, [make_row("a", 1)], MagicMock())
+        update_charts.assert_not_called()
+
+        charts._apply_refresh(charts._refresh_generation, [make_row("b", 1)], MagicMock())
+        update_charts.assert_called_once()
@@ -97,6 +97,12 @@ class TestExecutionConfig:
         with pytest.raises(ValueError):
             ExecutionConfig(timeout_seconds=601)
 
+    def test_max_concurrency(self) -> None:
+        """Test default and minimum concurrency limit."""
+        assert ExecutionConfig().max_concurrency == 5
+        with pytest.raises(ValueError):
+            ExecutionConfig(max_concurrency=0)
+
 
 class TestEvaluationConfig:
     """Tests for EvaluationConfig validation."""
@@ -254,6 +260,42 @@ path = "test.duckdb"
             del os.environ["KEY2"]
             del os.environ["EVAL_KEY"]
 
+    def test_load_returns_independent_copies_and_sees_changes(self) -> None:
+        """Test that cached loads are isolated and reflect file changes."""
+        os.environ["KEY1"] = "key1"
+        os.environ["KEY2"] = "key2"
+        os.environ["EVAL_KEY"] = "eval"
+
+        config = AppConfig(
+            execution=ExecutionConfig(timeout_seconds=90),
+            task_agents=[
+                ModelConfig(provider="openai", model="gpt-4o", api_key_env="KEY1"),
+                ModelConfig(provider="anthropic", model="claude-sonnet-4", api_key_env="KEY2"),
+            ],
+            evaluation_agent=EvaluationConfig(
+                provider="openai", model="gpt-4o", api_key_env="EVAL_KEY", prompt="Test"
+            ),
+            database=DatabaseConfig(),
+        )
+
+        with tempfile.NamedTemporaryFile(suffix=".toml", delete=False) as f:
+            temp_path = f.name
+
+        try:
+            ConfigLoader.save(config, temp_path)
+
+            first = ConfigLoader.load(temp_path)
+            first.execution.timeout_seconds = 5
+            assert ConfigLoader.load(temp_path).execution.timeout_seconds == 90
+
+            ConfigLoader.save(first, temp_path)
+            assert ConfigLoader.load(temp_path).execution.timeout_seconds == 5
+        finally:
+            Path(temp_path).unlink()
+            del os.environ["KEY1"]
+            del os.environ["KEY2"]
+            del os.environ["EVAL_KEY"]
+
     def test_load_nonexistent_file(self) -> None:
         """Test that loading nonexistent file raises FileNotFoundError."""
         with pytest.raises(FileNotFoundError):
@@ -165,6 +165,32 @@ class TestAgentExecution:
         )
         assert execution.token_count == 0
 
+    def test_messages_parsed_once_per_json(self) -> None:
+        """Test that decoded messages are reused until the JSON is replaced."""
+        execution = AgentExecution(task_id=1, model_provider="openai", model_name="gpt-4o")
+        assert execution.messages is None
+
+        execution.all_messages_json = '[{"kind": "request"}]'
+        messages = execution.messages
+        assert messages == [{"kind": "request"}]
+        assert execution.messages is messages
+
+        execution.all_messages_json = '{"error": "boom"}'
+        assert execution.messages == {"error": "boom"}
+
+    def test_equality_ignores_messages_cache(self) -> None:
+        """Test that parsing messages does not make an execution differ from its copy."""
+        execution = AgentExecution(
+            task_id=1,
+            model_provider="openai",
+            model_name="gpt-4o",
+            all_messages_json='[{"kind": "request"}]',
+        )
+        copy = execution.model_copy()
+        assert execution.messages == [{"kind": "request"}]
+        assert execution == copy
+        assert execution != execution.model_copy(update={"response_text": "done"})
+
 
 class TestEvaluationResult:
     """Tests for EvaluationResult domain model."""
@@ -214,6 +240,23 @@ class TestEvaluationResult:
         evaluation = EvaluationResult(execution_id=1, score=75, explanation="  Good work  \n")
         assert evaluation.explanation_trimmed == "Good work"
 
+    def test_bulk_create_shares_timestamp(self) -> None:
+        """Test that bulk-created evaluations share a single evaluation timestamp."""
+        evaluations = EvaluationResult.bulk_create(
+            [
+                {"execution_id": 1, "score": 80, "explanation": "Good"},
+                {"execution_id": 2, "score": 40, "explanation": "Weak"},
+            ]
+        )
+
+        assert [evaluation.execution_id for evaluation in evaluations] == [1, 2]
+        assert evaluations[0].evaluated_at == evaluations[1].evaluated_at
+
+    def test_bulk_create_validates_rows(self) -> None:
+        """Test that bulk creation still rejects invalid scores."""
+        with pytest.raises(ValueError):
+            EvaluationResult.bulk_create([{"execution_id": 1, "score": 101, "explanation": "x"}])
+
     def test_is_passing_below_threshold(self) -> None:
         """Test is_passing returns False for score below 50."""
         evaluation = EvaluationResult(execution_id=1, score=49, explanation="Test")
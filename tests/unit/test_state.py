@@ -0,0 +1,56 @@
+"""Unit tests for multi-agent execution state tracking."""
+
+import pytest
+
+from src.execution.state import AgentExecutionState, MultiAgentExecutionState
+from src.models.execution import ExecutionStatus
+
+
+class TestMultiAgentExecutionState:
+    """Tests for MultiAgentExecutionState status aggregation."""
+
+    @pytest.fixture
+    def state(self) -> MultiAgentExecutionState:
+        """Create a state tracker with three running agents."""
+        state = MultiAgentExecutionState(task_id=1)
+        state.add_agent("openai", "gpt-4o")
+        state.add_agent("anthropic", "claude-sonnet-4")
+        state.add_agent("gemini", "gemini-2.5-flash")
+        return state
+
+    def test_all_completed_requires_terminal_status(self, state: MultiAgentExecutionState) -> None:
+        """Test that all_completed is False until every agent is terminal."""
+        state.update_status("openai/gpt-4o", ExecutionStatus.COMPLETED)
+        state.update_status("anthropic/claude-sonnet-4", ExecutionStatus.FAILED)
+        assert state.all_completed() is False
+
+        state.update_status("gemini/gemini-2.5-flash", ExecutionStatus.TIMEOUT)
+        assert state.all_completed() is True
+
+    def test_completed_and_failed_counts(self, state: MultiAgentExecutionState) -> None:
+        """Test counting successful and unsuccessful agents."""
+        state.update_status("openai/gpt-4o", ExecutionStatus.COMPLETED)
+        state.update_status("anthropic/claude-sonnet-4", ExecutionStatus.FAILED)
+        state.update_status("gemini/gemini-2.5-flash", ExecutionStatus.TIMEOUT)
+
+        assert state.get_completed_count() == 1
+        assert state.get_failed_count() == 2
+
+    def test_reset_forgets_agents(self, state: MultiAgentExecutionState) -> None:
+        """Test that reset starts tracking a new task with no agents."""
+        state.reset(2)
+
+        assert state.task_id == 2
+        assert state.agent_states == {}
+
+    def test_update_unknown_agent_raises(self, state: MultiAgentExecutionState) -> None:
+        """Test that updating an unknown agent raises KeyError."""
+        with pytest.raises(KeyError, match="Unknown agent"):
+            state.update_status("openai/unknown", ExecutionStatus.COMPLETED)
+
+    def test_state_uses_slots(self) -> None:
+        """Test that state objects do not carry a per-instance __dict__."""
+        agent_state = AgentExecutionState(model_provider="openai", model_name="gpt-4o")
+
+        assert not hasattr(agent_state, "__dict__")
+        assert agent_state.model_identifier == "openai/gpt-4o"